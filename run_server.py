@@ -10,10 +10,6 @@ uvx로 실행하기 위한 엔트리 포인트입니다.
 """
 
 import sys
-import os
-
-# 현재 디렉토리를 Python 경로에 추가
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # 메인 모듈 임포트 및 실행
 if __name__ == "__main__":
@@ -31,7 +27,7 @@ if __name__ == "__main__":
     except ImportError as e:
         print(f"Import 오류: {e}")
         print("의존성을 설치했는지 확인해주세요:")
-        print("uv pip install -r requirements.txt")
+        print("uv pip install -e .")
         sys.exit(1)
     except Exception as e:
         print(f"서버 실행 오류: {e}")
@@ -7,21 +7,14 @@ Claude Desktop에서 직접 사용할 수 있도록 최적화되었습니다.
 """
 
 import sys
-import os
-import asyncio
 import logging
 
-# 현재 파일의 경로를 기준으로 src 디렉토리를 Python 경로에 추가
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, "src")
-sys.path.insert(0, src_dir)
-
 try:
     from mempool_ws_mcp_server.standard_mcp_server import main
 except ImportError as e:
     print(f"Error importing MCP server: {e}", file=sys.stderr)
-    print("Please ensure all dependencies are installed:", file=sys.stderr)
-    print("  pip install -r requirements.txt", file=sys.stderr)
+    print("Please ensure the package is installed:", file=sys.stderr)
+    print("  pip install -e .", file=sys.stderr)
     sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """환경변수 기반 설정 관리."""
 
+import functools
 import os
 from typing import Optional
 
@@ -11,6 +12,12 @@ class Config:
     HOST: str = os.getenv("MCP_HOST", "127.0.0.1")
     PORT: int = int(os.getenv("MCP_PORT", "8000"))
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    HTTP_API_PORT: int = int(os.getenv("HTTP_API_PORT", "8001"))
+    WORKERS: int = int(
+        os.getenv("MCP_WORKERS")
+        or os.getenv("WEB_CONCURRENCY")
+        or str(min(2 * (os.cpu_count() or 1) + 1, 8))
+    )
     
     # Mempool API 설정
     MEMPOOL_WS_URL: str = os.getenv("MEMPOOL_WS_URL", "wss://mempool.space/api/v1/ws")
@@ -21,6 +28,9 @@ class Config:
     WS_MAX_RECONNECT_ATTEMPTS: int = int(os.getenv("WS_MAX_RECONNECT_ATTEMPTS", "10"))
     WS_PING_INTERVAL: int = int(os.getenv("WS_PING_INTERVAL", "30"))
     WS_PING_TIMEOUT: int = int(os.getenv("WS_PING_TIMEOUT", "10"))
+    # 프레임 최대 크기 (mempool-blocks 등 큰 메시지 대비) 및 per-message deflate 사용 여부
+    WS_MAX_SIZE: int = int(os.getenv("WS_MAX_SIZE", str(4 * 1024 * 1024)))
+    WS_COMPRESSION: bool = os.getenv("WS_COMPRESSION", "false").lower() == "true"
     
     # HTTP 클라이언트 설정
     HTTP_TIMEOUT: int = int(os.getenv("HTTP_TIMEOUT", "30"))
@@ -29,18 +39,52 @@ class Config:
     # 성능 설정
     MAX_MESSAGE_QUEUE_SIZE: int = int(os.getenv("MAX_MESSAGE_QUEUE_SIZE", "1000"))
     MESSAGE_BATCH_SIZE: int = int(os.getenv("MESSAGE_BATCH_SIZE", "10"))
+    # /health 응답 캐시 유효 시간 및 상태 조회 실패 시 마지막 응답을 대신 쓸 수 있는 시간 (초)
+    HEALTH_CACHE_TTL: float = float(os.getenv("HEALTH_CACHE_TTL", "2"))
+    HEALTH_CACHE_STALE_TTL: float = float(os.getenv("HEALTH_CACHE_STALE_TTL", "30"))
+    
+    # Uvicorn 부하 제한 설정
+    HTTP_LIMIT_CONCURRENCY: int = int(os.getenv("HTTP_LIMIT_CONCURRENCY", str(MAX_MESSAGE_QUEUE_SIZE)))
+    # 워커 재시작 한도 - 멀티 워커(WORKERS > 1) 슈퍼바이저가 있을 때만 적용됨
+    HTTP_LIMIT_MAX_REQUESTS: int = int(os.getenv("HTTP_LIMIT_MAX_REQUESTS", "10000"))
+    HTTP_BACKLOG: int = int(os.getenv("HTTP_BACKLOG", "2048"))
+    HTTP_TIMEOUT_KEEP_ALIVE: int = int(os.getenv("HTTP_TIMEOUT_KEEP_ALIVE", "5"))
     
     # 보안 설정
-    ALLOWED_ORIGINS: list[str] = os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    ALLOWED_ORIGINS: frozenset[str] = frozenset(
+        origin.strip()
+        for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+        if origin.strip()
+    )
+    CORS_ALLOW_ALL: bool = "*" in ALLOWED_ORIGINS
     CORS_ENABLED: bool = os.getenv("CORS_ENABLED", "true").lower() == "true"
+    CORS_MIDDLEWARE_KWARGS: dict = {
+        "allow_origins": ["*"] if CORS_ALLOW_ALL else sorted(ALLOWED_ORIGINS),
+        "allow_credentials": True,
+        "allow_methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        "allow_headers": ["*"],
+        "expose_headers": ["*"],
+    }
     
     # 개발 모드
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     RELOAD: bool = os.getenv("RELOAD", "false").lower() == "true"
+    # 도구 응답 JSON 들여쓰기 (디버깅용, 기본값은 압축 출력)
+    PRETTY_JSON: bool = os.getenv("MCP_PRETTY_JSON", "false").lower() == "true"
+    
+    @classmethod
+    def get_uvicorn_limits(cls) -> dict:
+        """Uvicorn 동시 처리 및 백로그 제한 설정을 반환합니다."""
+        return {
+            "limit_concurrency": cls.HTTP_LIMIT_CONCURRENCY,
+            "backlog": cls.HTTP_BACKLOG,
+            "timeout_keep_alive": cls.HTTP_TIMEOUT_KEEP_ALIVE,
+        }
     
     @classmethod
+    @functools.cache
     def get_log_config(cls) -> dict:
-        """로깅 설정을 반환합니다."""
+        """로깅 설정을 반환합니다 (최초 호출 시 한 번만 생성)."""
         return {
             "version": 1,
             "disable_existing_loggers": False,
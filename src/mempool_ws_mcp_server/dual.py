@@ -0,0 +1,147 @@
+"""MCP 서버와 HTTP API 서버를 하나의 이벤트 루프에서 동시에 실행.
+
+1. MCP 서버 (MCP_PORT, 기본 8000) - /mcp 엔드포인트
+2. HTTP API 서버 (HTTP_API_PORT, 기본 8001) - 디버깅 및 상태 확인용
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+import sys
+from typing import Iterable
+
+import uvicorn
+import structlog
+
+try:
+    import uvloop
+except ImportError:  # Windows 등 uvloop 미지원 환경
+    uvloop = None
+
+from .config import config
+from .http_api import app
+from .rest_client import rest_client
+from .tools import create_mcp_server, initialize_websocket
+
+logger = structlog.get_logger(__name__)
+
+
+class _LoopSignalServer(uvicorn.Server):
+    """시그널 처리를 이벤트 루프에 맡기는 Uvicorn 서버 (서버별 signal.signal 설치 생략)."""
+
+    def capture_signals(self):
+        """uvicorn 0.29+ 시그널 캡처 비활성화."""
+        return contextlib.nullcontext()
+
+    def install_signal_handlers(self) -> None:
+        """이전 uvicorn 버전의 시그널 핸들러 설치 비활성화."""
+
+
+def setup_signal_handlers(servers: Iterable[uvicorn.Server]) -> None:
+    """SIGINT/SIGTERM을 이벤트 루프에 등록해 모든 서버를 한 번에 종료."""
+    servers = tuple(servers)
+    loop = asyncio.get_running_loop()
+
+    def _handle_exit() -> None:
+        for server in servers:
+            # 두 번째 SIGINT는 진행 중인 요청을 기다리지 않고 강제 종료
+            if server.should_exit:
+                server.force_exit = True
+            else:
+                server.should_exit = True
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Windows 이벤트 루프는 미지원 (KeyboardInterrupt로 종료)
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, _handle_exit)
+
+def build_mcp_server() -> uvicorn.Server:
+    """MCP 서버용 Uvicorn 서버 생성"""
+    mcp_app = create_mcp_server().http_app(path="/mcp", transport="streamable-http")
+    return _LoopSignalServer(
+        uvicorn.Config(
+            mcp_app,
+            host=config.HOST,
+            port=config.PORT,
+            loop="uvloop" if uvloop is not None else "auto",
+            http="httptools",
+            # MCP 트래픽 경로에서는 요청당 동기 액세스 로그를 남기지 않음
+            log_level="warning",
+            access_log=False,
+            **config.get_uvicorn_limits()
+        )
+    )
+
+def build_http_server() -> uvicorn.Server:
+    """HTTP API 서버용 Uvicorn 서버 생성"""
+    return _LoopSignalServer(
+        uvicorn.Config(
+            app,
+            host=config.HOST,
+            port=config.HTTP_API_PORT,
+            loop="uvloop" if uvloop is not None else "auto",
+            http="httptools",
+            # 디버깅용 포트이므로 액세스 로그 유지
+            log_level=config.LOG_LEVEL.lower(),
+            **config.get_uvicorn_limits()
+        )
+    )
+
+async def _warm_rest_endpoint(fetch) -> None:
+    """REST 연결 풀 예열 (실패해도 서버 시작을 막지 않음)"""
+    try:
+        await fetch()
+    except Exception as e:
+        logger.warning("REST prefetch failed", error=str(e))
+
+async def initialize_services():
+    """서비스 초기화 - WebSocket 연결과 REST 예열을 동시에 진행"""
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(initialize_websocket())
+            tg.create_task(_warm_rest_endpoint(rest_client.get_blocks_tip_height))
+            tg.create_task(_warm_rest_endpoint(rest_client.get_fees_recommended))
+        logger.info("WebSocket initialized successfully")
+    except* Exception as eg:
+        logger.error("Failed to initialize WebSocket", error=str(eg.exceptions[0]))
+        raise
+
+async def main_async():
+    """두 ASGI 앱을 하나의 이벤트 루프에서 동시에 실행"""
+    mcp_server = build_mcp_server()
+    http_server = build_http_server()
+
+    print("=== 서버 시작됨 ===")
+    print(f"MCP 서버: http://localhost:{config.PORT}/mcp")
+    print(f"HTTP API 서버: http://localhost:{config.HTTP_API_PORT}")
+    print(f"상태 확인: http://localhost:{config.HTTP_API_PORT}/health")
+    print(f"MCP 정보: http://localhost:{config.HTTP_API_PORT}/mcp/info")
+    print("===================")
+
+    # 두 서버가 각자 시그널 핸들러를 덮어쓰지 않도록 루프에 한 번만 등록
+    setup_signal_handlers((mcp_server, http_server))
+
+    # 같은 루프에서 실행되므로 ws_manager 싱글턴을 스레드 간 락 없이 공유
+    await asyncio.gather(
+        mcp_server.serve(),
+        http_server.serve(),
+        initialize_services()
+    )
+
+def main():
+    """메인 함수"""
+    # 로깅 설정
+    logging.basicConfig(level=logging.INFO)
+    
+    # asyncio.run이 uvloop 루프를 생성하도록 정책 설치
+    if uvloop is not None:
+        uvloop.install()
+    
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        print("\n사용자에 의해 서버가 중단되었습니다.")
+    except Exception as e:
+        logger.error("서버 시작 실패", error=str(e))
+        sys.exit(1)
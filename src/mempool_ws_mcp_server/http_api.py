@@ -2,26 +2,45 @@
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 
+import orjson
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from .config import config
+from .rest_client import rest_client
 from .tools import initialize_websocket, ws_manager
 
 # 로깅 설정
 logger = structlog.get_logger(__name__)
 
 
+class ORJSONResponse(Response):
+    """orjson으로 바로 bytes를 만드는 JSON 응답 (문자열이 아닌 dict 키도 허용)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """응답 본문을 직렬화합니다."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """FastAPI 라이프사이클 관리."""
     logger.info("Starting HTTP API Server")
     
+    # 이전 실행(또는 다른 앱 인스턴스)의 헬스 응답이 남지 않도록 캐시 초기화
+    invalidate_health_cache()
+    
+    # 동기 호출로 루프가 멈추는지 /health에서 확인할 수 있도록 지연 측정
+    lag_watchdog = asyncio.create_task(ws_manager.watch_loop_lag(), name="loop-lag-watchdog")
+    
     try:
         # WebSocket 연결 초기화
         await initialize_websocket()
@@ -33,10 +52,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         # 정리 작업
         logger.info("Shutting down HTTP API server")
+        lag_watchdog.cancel()
         try:
             await ws_manager.disconnect()
         except Exception as e:
             logger.error("Error during HTTP API server shutdown", error=str(e))
+        finally:
+            # WebSocket 해제가 실패해도 REST 커넥션 풀은 항상 닫음
+            try:
+                await rest_client.close()
+            except Exception as e:
+                logger.error("Failed to close REST client", error=str(e))
 
 
 # FastAPI 앱 생성
@@ -44,65 +70,123 @@ app = FastAPI(
     title="Mempool WebSocket MCP Server - HTTP API",
     description="비트코인 mempool.space WebSocket API를 위한 MCP 서버의 HTTP API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS 설정
 if config.CORS_ENABLED:
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] if "*" in config.ALLOWED_ORIGINS else config.ALLOWED_ORIGINS,
-        allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        allow_headers=["*"],
-        expose_headers=["*"]
-    )
+    app.add_middleware(CORSMiddleware, **config.CORS_MIDDLEWARE_KWARGS)
+
+
+# 정적 응답 본문 - 요청마다 dict 생성/직렬화하지 않도록 import 시점에 한 번만 생성
+_ROOT_BYTES = orjson.dumps({
+    "message": "Mempool WebSocket MCP Server - HTTP API",
+    "version": "1.0.0",
+    "description": "비트코인 mempool.space WebSocket API를 위한 MCP 서버의 HTTP API",
+    "endpoints": {
+        "health": "/health",
+        "mcp_info": "/mcp/info",
+        "docs": "/docs"
+    },
+    "mcp_server": {
+        "url": f"http://{config.HOST}:{config.PORT}/mcp",
+        "transport": "streamable-http",
+        "note": f"MCP 서버는 포트 {config.PORT}에서 실행됩니다"
+    }
+})
+
+_MCP_INFO_STATIC = {
+    "server": "Mempool WebSocket MCP Server",
+    "version": "1.0.0",
+    "transport": "streamable-http",
+    "mcp_endpoint": f"http://{config.HOST}:{config.PORT}/mcp",
+    "available_tools": [
+        "subscribe_blocks", "subscribe_mempool_blocks", "subscribe_stats",
+        "subscribe_live_chart", "track_address", "get_connection_status",
+        "unsubscribe_client", "get_address_info", "get_address_balance",
+        "get_address_utxos", "get_address_transactions", "get_address_bundle",
+        "get_recommended_fees", "get_mempool_info", "get_transaction_info",
+        "get_block_info", "get_block_height", "validate_bitcoin_address"
+    ],
+    "usage_example": {
+        "initialize": {
+            "method": "POST",
+            "url": f"http://{config.HOST}:{config.PORT}/mcp",
+            "headers": {"Content-Type": "application/json"},
+            "body": {
+                "jsonrpc": "2.0",
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "test-client", "version": "1.0.0"}
+                },
+                "id": 1
+            }
+        }
+    }
+}
+
+
+# /health 응답 캐시 - 모니터링 프로브가 짧은 간격으로 호출해도 상태 조회/직렬화는 TTL마다 한 번
+_health_body: Optional[bytes] = None
+_health_fresh_until = 0.0
+_health_stale_until = 0.0
+
+
+def invalidate_health_cache() -> None:
+    """/health 응답 캐시를 비웁니다 (앱 시작 시 및 테스트용)."""
+    global _health_body, _health_fresh_until, _health_stale_until
+    _health_body = None
+    _health_fresh_until = 0.0
+    _health_stale_until = 0.0
 
 
 @app.get("/")
 async def root():
     """루트 엔드포인트."""
-    return {
-        "message": "Mempool WebSocket MCP Server - HTTP API",
-        "version": "1.0.0",
-        "description": "비트코인 mempool.space WebSocket API를 위한 MCP 서버의 HTTP API",
-        "endpoints": {
-            "health": "/health",
-            "mcp_info": "/mcp/info",
-            "docs": "/docs"
-        },
-        "mcp_server": {
-            "url": f"http://{config.HOST}:8000/mcp",
-            "transport": "streamable-http",
-            "note": "MCP 서버는 포트 8000에서 실행됩니다"
-        }
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트."""
+    global _health_body, _health_fresh_until, _health_stale_until
+    
+    now = time.monotonic()
+    if _health_body is not None and now < _health_fresh_until:
+        return Response(_health_body, media_type="application/json", headers={"X-Cache": "hit"})
+    
     try:
         status = await ws_manager.get_connection_status()
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "healthy",
-                "websocket_connected": status["connected"],
-                "active_subscriptions": status.get("active_subscriptions", 0),
-                "server": "Mempool WebSocket MCP Server - HTTP API"
-            }
-        )
+        body = orjson.dumps({
+            "status": "healthy",
+            "websocket_connected": status["connected"],
+            "active_subscriptions": status.get("active_subscriptions", 0),
+            "total_clients": status.get("total_clients", 0),
+            "loop_lag_ms": status.get("loop_lag_ms"),
+            "server": "Mempool WebSocket MCP Server - HTTP API"
+        })
     except Exception as e:
         logger.error("Health check failed", error=str(e))
-        return JSONResponse(
+        # 최근 정상 응답이 있으면 그대로 반환 (오래된 응답은 장애를 가리지 않도록 사용하지 않음)
+        if _health_body is not None and now < _health_stale_until:
+            return Response(_health_body, media_type="application/json", headers={"X-Cache": "stale"})
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": str(e),
                 "server": "Mempool WebSocket MCP Server - HTTP API"
-            }
+            },
+            headers={"X-Cache": "miss"}
         )
+    
+    _health_body = body
+    _health_fresh_until = now + config.HEALTH_CACHE_TTL
+    _health_stale_until = now + config.HEALTH_CACHE_STALE_TTL
+    return Response(body, media_type="application/json", headers={"X-Cache": "miss"})
 
 
 @app.get("/mcp/info")
@@ -113,38 +197,11 @@ async def mcp_info():
     except Exception:
         ws_status = {"connected": False, "error": "Failed to get status"}
     
-    return {
-        "server": "Mempool WebSocket MCP Server",
-        "version": "1.0.0",
-        "transport": "streamable-http",
-        "mcp_endpoint": f"http://{config.HOST}:8000/mcp",
-        "available_tools": [
-            "subscribe_blocks", "subscribe_mempool_blocks", "subscribe_stats",
-            "subscribe_live_chart", "track_address", "get_connection_status",
-            "unsubscribe_client", "get_address_info", "get_address_balance",
-            "get_address_utxos", "get_address_transactions", "get_recommended_fees",
-            "get_mempool_info", "get_transaction_info", "get_block_info",
-            "get_block_height", "validate_bitcoin_address"
-        ],
-        "websocket_status": ws_status,
-        "usage_example": {
-            "initialize": {
-                "method": "POST",
-                "url": f"http://{config.HOST}:8000/mcp",
-                "headers": {"Content-Type": "application/json"},
-                "body": {
-                    "jsonrpc": "2.0",
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {"name": "test-client", "version": "1.0.0"}
-                    },
-                    "id": 1
-                }
-            }
-        }
-    }
+    # 정적 부분은 미리 만든 dict를 재사용하고 동적 상태만 병합
+    return Response(
+        orjson.dumps({**_MCP_INFO_STATIC, "websocket_status": ws_status}),
+        media_type="application/json"
+    )
 
 
 @app.get("/status")
@@ -154,15 +211,15 @@ async def status():
         ws_status = await ws_manager.get_connection_status()
         
         return {
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
             "services": {
-                "http_api": {"status": "running", "port": 8001},
-                "mcp_server": {"status": "running", "port": 8000},
+                "http_api": {"status": "running", "port": config.HTTP_API_PORT},
+                "mcp_server": {"status": "running", "port": config.PORT},
                 "websocket": ws_status
             }
         }
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Failed to get status",
@@ -1,16 +1,25 @@
 """Mempool WebSocket MCP Server - FastMCP 구현."""
 
 import asyncio
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 import structlog
+import uvicorn
+
+try:
+    import uvloop
+except ImportError:  # Windows 등 uvloop 미지원 환경
+    uvloop = None
 
 from .config import config
 from .tools import create_mcp_server, initialize_websocket
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정 - 핸들러와 리스너 스레드는 진입점에서 setup_logging()으로 시작
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
@@ -30,10 +39,31 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
+_log_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> None:
+    """이벤트 루프 스레드는 큐에 넣기만 하고 스트림 쓰기는 리스너 스레드가 담당하도록 로깅 구성."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+
 
 def main():
     """메인 함수 - MCP 서버를 Streamable HTTP 모드로 실행."""
+    setup_logging()
     try:
+        # asyncio.run이 uvloop 루프를 생성하도록 정책 설치
+        if uvloop is not None:
+            uvloop.install()
+
         # WebSocket 초기화
         asyncio.run(initialize_websocket())
         
@@ -48,7 +78,9 @@ def main():
             transport="streamable-http", 
             host=config.HOST, 
             port=config.PORT, 
-            path="/mcp"
+            path="/mcp",
+            # 이벤트 루프는 함수 시작 시 설치한 uvloop 정책을 따르고, HTTP 파서만 명시
+            uvicorn_config={"access_log": False, "http": "httptools", **config.get_uvicorn_limits()}
         )
         
     except KeyboardInterrupt:
@@ -61,7 +93,12 @@ def main():
 
 def main_stdio():
     """STDIO 모드로 MCP 서버 실행."""
+    setup_logging()
     try:
+        # asyncio.run이 uvloop 루프를 생성하도록 정책 설치
+        if uvloop is not None:
+            uvloop.install()
+
         # WebSocket 초기화
         asyncio.run(initialize_websocket())
         
@@ -80,9 +117,41 @@ def main_stdio():
         sys.exit(1)
 
 
+def run_http_server():
+    """HTTP API 서버를 CPU 수 기반 멀티 워커로 실행."""
+    setup_logging()
+    try:
+        logger.info("Starting HTTP API server",
+                   host=config.HOST, port=config.HTTP_API_PORT, workers=config.WORKERS)
+        
+        # 멀티 워커는 앱 인스턴스가 아닌 import 문자열로만 지원됨
+        # 각 워커는 lifespan에서 자체 WebSocket 연결을 초기화함
+        uvicorn.run(
+            "mempool_ws_mcp_server.http_api:app",
+            host=config.HOST,
+            port=config.HTTP_API_PORT,
+            workers=config.WORKERS,
+            loop="uvloop" if uvloop is not None else "auto",
+            http="httptools",
+            # 워커 재시작은 멀티 워커 슈퍼바이저가 담당하므로 워커가 둘 이상일 때만 적용
+            # (단일 워커는 슈퍼바이저 없이 실행되어 한도에 도달하면 서버가 종료됨)
+            limit_max_requests=config.HTTP_LIMIT_MAX_REQUESTS if config.WORKERS > 1 else None,
+            **config.get_uvicorn_limits()
+        )
+        
+    except KeyboardInterrupt:
+        logger.info("Server interrupted by user")
+        sys.exit(0)
+    except Exception as e:
+        logger.error("Server startup failed", error=str(e))
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     # 인자에 따라 다른 모드로 실행
     if len(sys.argv) > 1 and sys.argv[1] == "stdio":
         main_stdio()
+    elif len(sys.argv) > 1 and sys.argv[1] == "http":
+        run_http_server()
     else:
         main()  # 기본적으로 Streamable HTTP 모드 
\ No newline at end of file
@@ -1,68 +1,115 @@
 """Mempool.space REST API 클라이언트."""
 
 import asyncio
-import json
+import functools
 from typing import Any, Dict, List, Optional, Union
 
-import aiohttp
+import httpx
+import orjson
 import structlog
+from async_lru import alru_cache
 
 from .config import config
 
 logger = structlog.get_logger(__name__)
 
+# 캐시 TTL (초) - 팁/수수료는 블록 주기보다 훨씬 짧게, 해시로 조회한 블록은 불변
+TIP_CACHE_TTL = 5
+MEMPOOL_CACHE_TTL = 5
+LOOKUP_CACHE_TTL = 10
+DIFFICULTY_CACHE_TTL = 60
+BLOCK_CACHE_TTL = 3600
+
+# 페이지네이션 엔드포인트 경로 템플릿 - 호출마다 params dict를 만들지 않도록 미리 바인딩
+_ADDRESS_TXS_AFTER = "/address/{address}/txs?after_txid={after_txid}".format_map
+_ADDRESS_TXS_CHAIN_AFTER = "/address/{address}/txs/chain/{last_seen_txid}".format_map
+_BLOCK_TXS_FROM = "/block/{hash}/txs/{start_index}".format_map
+_BLOCKS_FROM = "/blocks/{start_height}".format_map
+
 
 class MempoolRestClient:
     """Mempool.space REST API 클라이언트."""
     
     def __init__(self, base_url: str = None):
         self.base_url = (base_url or config.MEMPOOL_API_URL).rstrip('/')
-        self._session: Optional[aiohttp.ClientSession] = None
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """HTTP 세션을 가져옵니다."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=config.HTTP_TIMEOUT),
-                headers={'User-Agent': 'MCP-Mempool-Client/1.0'}
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # 고정 경로 엔드포인트는 경로를 미리 바인딩해 호출마다 분기/문자열 조합을 생략
+        self._fetch_blocks = functools.partial(self._request, "/blocks")
+        self._fetch_tip_height = functools.partial(self._request_bytes, "/blocks/tip/height")
+        self._fetch_tip_hash = functools.partial(self._request_bytes, "/blocks/tip/hash")
+        self._fetch_mempool = functools.partial(self._request, "/mempool")
+        self._fetch_mempool_txids = functools.partial(self._request, "/mempool/txids")
+        self._fetch_mempool_recent = functools.partial(self._request, "/mempool/recent")
+        self._fetch_fees_recommended = functools.partial(self._request, "/v1/fees/recommended")
+        self._fetch_fees_mempool_blocks = functools.partial(self._request, "/v1/fees/mempool-blocks")
+        self._fetch_difficulty_adjustment = functools.partial(self._request, "/v1/difficulty-adjustment")
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """HTTP/2 클라이언트를 가져옵니다."""
+        if self._client is None or self._client.is_closed:
+            # 단일 호스트이므로 HTTP/2 하나의 연결로 요청을 다중화
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                timeout=config.HTTP_TIMEOUT,
+                headers={'User-Agent': 'MCP-Mempool-Client/1.0'},
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=60
+                )
             )
-        return self._session
+        return self._client
     
     async def close(self):
-        """세션을 종료합니다."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """클라이언트를 종료합니다."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
     
-    async def _request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """HTTP 요청을 보냅니다."""
+    async def _request_bytes(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """HTTP 요청을 보내고 디코딩하지 않은 응답 본문을 반환합니다."""
         url = f"{self.base_url}{endpoint}"
-        session = await self._get_session()
+        client = await self._get_client()
         
         try:
-            async with session.get(url, params=params) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientError as e:
+            # 쿼리 파라미터가 없는 일반적인 경우엔 params 인자를 넘기지 않음
+            if params is None:
+                response = await client.get(endpoint)
+            else:
+                response = await client.get(endpoint, params=params)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPError as e:
             logger.error("HTTP request failed", url=url, error=str(e))
             raise
         except Exception as e:
             logger.error("Unexpected error in HTTP request", url=url, error=str(e))
             raise
     
+    async def _request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """HTTP 요청을 보내고 JSON 응답을 디코딩합니다."""
+        return orjson.loads(await self._request_bytes(endpoint, params=params))
+    
     # 주소 관련 API
+    @alru_cache(maxsize=1024, ttl=LOOKUP_CACHE_TTL)
     async def get_address(self, address: str) -> Dict[str, Any]:
         """주소 정보를 가져옵니다."""
         return await self._request(f"/address/{address}")
     
     async def get_address_txs(self, address: str, after_txid: Optional[str] = None) -> List[Dict[str, Any]]:
         """주소의 거래 내역을 가져옵니다."""
-        params = {"after_txid": after_txid} if after_txid else None
-        return await self._request(f"/address/{address}/txs", params=params)
+        if after_txid:
+            return await self._request(_ADDRESS_TXS_AFTER({"address": address, "after_txid": after_txid}))
+        return await self._request(f"/address/{address}/txs")
     
     async def get_address_txs_chain(self, address: str, last_seen_txid: Optional[str] = None) -> List[Dict[str, Any]]:
         """주소의 확인된 거래 내역을 가져옵니다."""
-        params = {"last_seen_txid": last_seen_txid} if last_seen_txid else None
-        return await self._request(f"/address/{address}/txs/chain", params=params)
+        if last_seen_txid:
+            return await self._request(
+                _ADDRESS_TXS_CHAIN_AFTER({"address": address, "last_seen_txid": last_seen_txid})
+            )
+        return await self._request(f"/address/{address}/txs/chain")
     
     async def get_address_txs_mempool(self, address: str) -> List[Dict[str, Any]]:
         """주소의 멤풀 거래 내역을 가져옵니다."""
@@ -72,19 +119,37 @@ class MempoolRestClient:
         """주소의 UTXO를 가져옵니다."""
         return await self._request(f"/address/{address}/utxo")
     
+    async def get_address_full(self, address: str) -> Dict[str, Any]:
+        """주소 정보, UTXO, 거래 내역을 동시에 가져옵니다."""
+        info, utxos, txs = await asyncio.gather(
+            self.get_address(address),
+            self.get_address_utxo(address),
+            self.get_address_txs(address)
+        )
+        return {"info": info, "utxos": utxos, "transactions": txs}
+    
     # 블록 관련 API
     async def get_block(self, hash_or_height: Union[str, int]) -> Dict[str, Any]:
         """블록 정보를 가져옵니다."""
+        # 해시로 조회한 블록만 불변이므로 캐시 (높이는 리오그 시 바뀔 수 있음)
+        if isinstance(hash_or_height, str) and len(hash_or_height) == 64:
+            return await self._get_block_by_hash(hash_or_height)
         return await self._request(f"/block/{hash_or_height}")
     
+    @alru_cache(maxsize=256, ttl=BLOCK_CACHE_TTL)
+    async def _get_block_by_hash(self, hash: str) -> Dict[str, Any]:
+        """해시로 블록 정보를 가져옵니다 (캐시됨)."""
+        return await self._request(f"/block/{hash}")
+    
     async def get_block_status(self, hash: str) -> Dict[str, Any]:
         """블록 상태를 가져옵니다."""
         return await self._request(f"/block/{hash}/status")
     
     async def get_block_txs(self, hash: str, start_index: int = 0) -> List[Dict[str, Any]]:
         """블록의 거래 목록을 가져옵니다."""
-        params = {"start_index": start_index} if start_index > 0 else None
-        return await self._request(f"/block/{hash}/txs", params=params)
+        if start_index > 0:
+            return await self._request(_BLOCK_TXS_FROM({"hash": hash, "start_index": start_index}))
+        return await self._request(f"/block/{hash}/txs")
     
     async def get_block_txids(self, hash: str) -> List[str]:
         """블록의 거래 ID 목록을 가져옵니다."""
@@ -92,26 +157,30 @@ class MempoolRestClient:
     
     async def get_block_txid(self, hash: str, index: int) -> str:
         """블록의 특정 인덱스 거래 ID를 가져옵니다."""
-        return await self._request(f"/block/{hash}/txid/{index}")
+        return (await self._request_bytes(f"/block/{hash}/txid/{index}")).decode()
     
-    async def get_block_raw(self, hash: str) -> str:
+    async def get_block_raw(self, hash: str) -> bytes:
         """블록의 raw 데이터를 가져옵니다."""
-        return await self._request(f"/block/{hash}/raw")
+        return await self._request_bytes(f"/block/{hash}/raw")
     
     async def get_blocks(self, start_height: Optional[int] = None) -> List[Dict[str, Any]]:
         """최근 블록 목록을 가져옵니다."""
-        params = {"start_height": start_height} if start_height else None
-        return await self._request("/blocks", params=params)
+        if start_height:
+            return await self._request(_BLOCKS_FROM({"start_height": start_height}))
+        return await self._fetch_blocks()
     
+    @alru_cache(maxsize=256, ttl=TIP_CACHE_TTL)
     async def get_blocks_tip_height(self) -> int:
         """최신 블록 높이를 가져옵니다."""
-        return await self._request("/blocks/tip/height")
+        return int(await self._fetch_tip_height())
     
+    @alru_cache(maxsize=256, ttl=TIP_CACHE_TTL)
     async def get_blocks_tip_hash(self) -> str:
         """최신 블록 해시를 가져옵니다."""
-        return await self._request("/blocks/tip/hash")
+        return (await self._fetch_tip_hash()).decode()
     
     # 거래 관련 API
+    @alru_cache(maxsize=1024, ttl=LOOKUP_CACHE_TTL)
     async def get_tx(self, txid: str) -> Dict[str, Any]:
         """거래 정보를 가져옵니다."""
         return await self._request(f"/tx/{txid}")
@@ -122,15 +191,15 @@ class MempoolRestClient:
     
     async def get_tx_hex(self, txid: str) -> str:
         """거래의 hex 데이터를 가져옵니다."""
-        return await self._request(f"/tx/{txid}/hex")
+        return (await self._request_bytes(f"/tx/{txid}/hex")).decode()
     
-    async def get_tx_raw(self, txid: str) -> str:
+    async def get_tx_raw(self, txid: str) -> bytes:
         """거래의 raw 데이터를 가져옵니다."""
-        return await self._request(f"/tx/{txid}/raw")
+        return await self._request_bytes(f"/tx/{txid}/raw")
     
     async def get_tx_merkleblock_proof(self, txid: str) -> str:
         """거래의 merkle block proof를 가져옵니다."""
-        return await self._request(f"/tx/{txid}/merkleblock-proof")
+        return (await self._request_bytes(f"/tx/{txid}/merkleblock-proof")).decode()
     
     async def get_tx_merkle_proof(self, txid: str) -> Dict[str, Any]:
         """거래의 merkle proof를 가져옵니다."""
@@ -146,43 +215,55 @@ class MempoolRestClient:
     
     async def post_tx(self, tx_hex: str) -> str:
         """거래를 브로드캐스트합니다."""
-        session = await self._get_session()
-        url = f"{self.base_url}/tx"
+        client = await self._get_client()
         
         try:
-            async with session.post(url, data=tx_hex, headers={'Content-Type': 'text/plain'}) as response:
-                response.raise_for_status()
-                return await response.text()
-        except aiohttp.ClientError as e:
+            response = await client.post("/tx", content=tx_hex, headers={'Content-Type': 'text/plain'})
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPError as e:
             logger.error("Transaction broadcast failed", error=str(e))
             raise
     
     # 멤풀 관련 API
+    @alru_cache(maxsize=256, ttl=MEMPOOL_CACHE_TTL)
     async def get_mempool(self) -> Dict[str, Any]:
         """멤풀 정보를 가져옵니다."""
-        return await self._request("/mempool")
+        return await self._fetch_mempool()
     
     async def get_mempool_txids(self) -> List[str]:
         """멤풀의 거래 ID 목록을 가져옵니다."""
-        return await self._request("/mempool/txids")
+        return await self._fetch_mempool_txids()
     
     async def get_mempool_recent(self) -> List[Dict[str, Any]]:
         """최근 멤풀 거래들을 가져옵니다.""" 
-        return await self._request("/mempool/recent")
+        return await self._fetch_mempool_recent()
     
     # 수수료 관련 API
+    @alru_cache(maxsize=256, ttl=TIP_CACHE_TTL)
     async def get_fees_recommended(self) -> Dict[str, int]:
         """추천 수수료를 가져옵니다."""
-        return await self._request("/v1/fees/recommended")
+        return await self._fetch_fees_recommended()
     
     async def get_fees_mempool_blocks(self) -> List[Dict[str, Any]]:
         """멤풀 블록별 수수료 정보를 가져옵니다."""
-        return await self._request("/v1/fees/mempool-blocks")
+        return await self._fetch_fees_mempool_blocks()
     
     # 난이도 조정 API
+    @alru_cache(maxsize=256, ttl=DIFFICULTY_CACHE_TTL)
     async def get_difficulty_adjustment(self) -> Dict[str, Any]:
         """난이도 조정 정보를 가져옵니다."""
-        return await self._request("/v1/difficulty-adjustment")
+        return await self._fetch_difficulty_adjustment()
+    
+    def invalidate_tip_cache(self) -> None:
+        """새 블록 수신 시 팁/수수료/멤풀 캐시와 주소/거래 조회 캐시를 무효화합니다."""
+        self.get_blocks_tip_height.cache_invalidate()
+        self.get_blocks_tip_hash.cache_invalidate()
+        self.get_fees_recommended.cache_invalidate()
+        self.get_mempool.cache_invalidate()
+        # 확인 상태가 바뀌었을 수 있으므로 주소/거래 조회 결과는 전부 비움
+        self.get_address.cache_clear()
+        self.get_tx.cache_clear()
     
     # 주소 접두사 검색 API
     async def validate_address(self, address: str) -> Dict[str, Any]:
@@ -190,5 +271,5 @@ class MempoolRestClient:
         return await self._request(f"/v1/validate-address/{address}")
 
 
-# 글로벌 클라이언트 인스턴스
+# 글로벌 클라이언트 인스턴스 (프로세스 내 모든 도구가 연결 풀을 공유)
 rest_client = MempoolRestClient() 
\ No newline at end of file
@@ -1,54 +1,55 @@
 """표준 MCP 라이브러리를 사용한 Mempool WebSocket MCP 서버 - Claude Desktop 호환."""
 
 import asyncio
-import json
+import functools
 import sys
-import uuid
+import secrets
 from datetime import datetime
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+import msgspec
+import orjson
 import structlog
+
+try:
+    import uvloop
+except ImportError:  # Windows 등 uvloop 미지원 환경
+    uvloop = None
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.server.models import InitializationOptions, ServerCapabilities
 from mcp.types import (
     Tool,
     TextContent,
-    GetPromptResult,
-    Prompt,
-    PromptArgument,
-    GetResourceResult,
-    Resource,
-    ResourceContents,
-    ResourceTemplate,
-    CallToolResult,
-    ListResourcesResult,
-    ListPromptsResult,
     ListToolsResult,
 )
 
-from .websocket_manager import WebSocketManager
+from .websocket_manager import MessageListener, WebSocketManager
 from .rest_client import rest_client
 from .config import config
 from .types import ChannelType
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+
+def _orjson_log_dumps(obj: Any, **kwargs: Any) -> str:
+    """structlog JSONRenderer용 orjson 직렬화 (PrintLogger는 str을 기대)."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+# 로깅 설정 - stdout은 MCP JSON-RPC 스트림이므로 structlog만 stderr로 직접 출력
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_log_dumps)
     ],
     context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+    # INFO 미만 호출은 프로세서 체인을 거치지 않고 바로 무시
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     cache_logger_on_first_use=True,
 )
 
@@ -58,573 +59,577 @@ logger = structlog.get_logger(__name__)
 ws_manager = WebSocketManager()
 
 
+# MCP_PRETTY_JSON이 켜진 경우에만 들여쓰기 (기본은 압축 출력)
+_DUMPS_OPTION = orjson.OPT_INDENT_2 if config.PRETTY_JSON else 0
+
+
+def _dumps(obj: Any) -> str:
+    """도구 응답을 orjson으로 직렬화합니다."""
+    return orjson.dumps(obj, option=_DUMPS_OPTION).decode()
+
+
+def _json_prefix(static: Dict[str, Any]) -> bytes:
+    """고정 필드를 미리 직렬화하고 닫는 괄호를 제거한 접두부를 만듭니다."""
+    return orjson.dumps(static, option=_DUMPS_OPTION)[:-1].rstrip(b"\n")
+
+
+def _splice(prefix: bytes, dynamic: Dict[str, Any]) -> str:
+    """미리 직렬화한 접두부 뒤에 동적 필드를 이어 붙입니다."""
+    return (prefix + b"," + orjson.dumps(dynamic, option=_DUMPS_OPTION)[1:]).decode()
+
+
+_ERROR_HEAD = b'{"error":'
+_ERROR_TAIL = b"}"
+
+
+def _error_json(message: str) -> str:
+    """고정된 에러 응답 틀에 메시지만 직렬화해 끼워 넣습니다."""
+    # 메시지 이스케이프는 orjson에 맡김 (따옴표, 역슬래시, 제어 문자 처리)
+    return (_ERROR_HEAD + orjson.dumps(message) + _ERROR_TAIL).decode()
+
+
+def _as_json_response(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[str]]:
+    """도구 메서드 결과를 JSON 문자열로 직렬화하고 예외는 에러 응답으로 변환합니다."""
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> str:
+        try:
+            result = await method(self, *args, **kwargs)
+            # 구독 응답처럼 미리 직렬화된 결과는 그대로 반환
+            return result if isinstance(result, str) else _dumps(result)
+        except Exception as e:
+            logger.error("Tool method failed", method=method.__name__, error=str(e))
+            return _error_json(str(e))
+    return wrapper
+
+
+# 도구 인자 스키마 (msgspec으로 검증 및 변환)
+class AddressArgs(msgspec.Struct):
+    """주소 인자."""
+    address: str
+
+
+class AddressTransactionsArgs(msgspec.Struct):
+    """주소 거래 내역 조회 인자."""
+    address: str
+    after_txid: Optional[str] = None
+
+
+class ClientArgs(msgspec.Struct):
+    """클라이언트 ID 인자."""
+    client_id: str
+
+
+class TxidArgs(msgspec.Struct):
+    """거래 ID 인자."""
+    txid: str
+
+
+class BlockArgs(msgspec.Struct):
+    """블록 해시 또는 높이 인자."""
+    hash_or_height: str
+
+
 class MempoolMCPServer:
     """Mempool WebSocket MCP 서버 클래스"""
     
     def __init__(self):
         self.server = Server("mempool-ws-mcp-server")
+        # 구독 응답의 고정 부분 (status, channel)은 채널별로 한 번만 직렬화
+        self._subscribed_prefixes = {
+            channel: _json_prefix({"status": "subscribed", "channel": channel})
+            for channel in (
+                ChannelType.BLOCKS,
+                ChannelType.MEMPOOL_BLOCKS,
+                ChannelType.STATS,
+                ChannelType.LIVE_2H_CHART,
+            )
+        }
+        # 도구 이름 -> (핸들러, 인자 스키마) 매핑
+        self._dispatch = {
+            "subscribe_blocks": (lambda a: self._subscribe_blocks(), None),
+            "subscribe_mempool_blocks": (lambda a: self._subscribe_mempool_blocks(), None),
+            "subscribe_stats": (lambda a: self._subscribe_stats(), None),
+            "subscribe_live_chart": (lambda a: self._subscribe_live_chart(), None),
+            "track_address": (lambda a: self._track_address(a.address), AddressArgs),
+            "get_connection_status": (lambda a: self._get_connection_status(), None),
+            "unsubscribe_client": (lambda a: self._unsubscribe_client(a.client_id), ClientArgs),
+            "get_address_info": (lambda a: self._get_address_info(a.address), AddressArgs),
+            "get_address_balance": (lambda a: self._get_address_balance(a.address), AddressArgs),
+            "get_address_utxos": (lambda a: self._get_address_utxos(a.address), AddressArgs),
+            "get_address_transactions": (
+                lambda a: self._get_address_transactions(a.address, a.after_txid),
+                AddressTransactionsArgs
+            ),
+            "get_address_bundle": (lambda a: self._get_address_bundle(a.address), AddressArgs),
+            "get_recommended_fees": (lambda a: self._get_recommended_fees(), None),
+            "get_mempool_info": (lambda a: self._get_mempool_info(), None),
+            "get_transaction_info": (lambda a: self._get_transaction_info(a.txid), TxidArgs),
+            "get_block_info": (lambda a: self._get_block_info(a.hash_or_height), BlockArgs),
+            "get_block_height": (lambda a: self._get_block_height(), None),
+            "validate_bitcoin_address": (
+                lambda a: self._validate_bitcoin_address(a.address),
+                AddressArgs
+            ),
+        }
         self._setup_handlers()
     
     def _setup_handlers(self):
         """핸들러 설정"""
         
+        # 도구 스키마는 상수이므로 한 번만 생성해 재사용
+        self._tools_result = ListToolsResult(
+            tools=[
+                Tool(
+                    name="subscribe_blocks",
+                    description="블록 정보를 구독합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="subscribe_mempool_blocks",
+                    description="멤풀 블록 정보를 구독합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="subscribe_stats",
+                    description="통계 정보를 구독합니다.",
+                    inputSchema={
+                        "type": "object", 
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="subscribe_live_chart",
+                    description="실시간 2시간 차트 데이터를 구독합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="track_address",
+                    description="특정 비트코인 주소를 추적합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "추적할 비트코인 주소"
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                ),
+                Tool(
+                    name="get_connection_status",
+                    description="WebSocket 연결 상태를 확인합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="unsubscribe_client",
+                    description="클라이언트의 모든 구독을 해제합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "client_id": {
+                                "type": "string",
+                                "description": "구독 해제할 클라이언트 ID"
+                            }
+                        },
+                        "required": ["client_id"]
+                    }
+                ),
+                Tool(
+                    name="get_address_info",
+                    description="주소 정보를 조회합니다 (잔액, 거래 수 등).",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "조회할 비트코인 주소"
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                ),
+                Tool(
+                    name="get_address_balance",
+                    description="주소의 잔액을 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "조회할 비트코인 주소"
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                ),
+                Tool(
+                    name="get_address_utxos",
+                    description="주소의 UTXO 목록을 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "조회할 비트코인 주소"
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                ),
+                Tool(
+                    name="get_address_transactions",
+                    description="주소의 거래 내역을 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "조회할 비트코인 주소"
+                            },
+                            "after_txid": {
+                                "type": "string",
+                                "description": "이 트랜잭션 ID 이후의 거래들을 조회 (선택사항)",
+                                "default": None
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                ),
+                Tool(
+                    name="get_address_bundle",
+                    description="주소 정보, UTXO, 거래 내역을 한 번에 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "조회할 비트코인 주소"
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                ),
+                Tool(
+                    name="get_recommended_fees",
+                    description="추천 수수료를 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="get_mempool_info",
+                    description="멤풀 정보를 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="get_transaction_info",
+                    description="거래 정보를 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "txid": {
+                                "type": "string",
+                                "description": "조회할 거래 ID"
+                            }
+                        },
+                        "required": ["txid"]
+                    }
+                ),
+                Tool(
+                    name="get_block_info",
+                    description="블록 정보를 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "hash_or_height": {
+                                "type": "string",
+                                "description": "블록 해시 또는 높이"
+                            }
+                        },
+                        "required": ["hash_or_height"]
+                    }
+                ),
+                Tool(
+                    name="get_block_height",
+                    description="현재 블록 높이를 조회합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {},
+                        "required": []
+                    }
+                ),
+                Tool(
+                    name="validate_bitcoin_address",
+                    description="비트코인 주소가 유효한지 검증합니다.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "address": {
+                                "type": "string",
+                                "description": "검증할 비트코인 주소"
+                            }
+                        },
+                        "required": ["address"]
+                    }
+                )
+            ]
+        )
+
         @self.server.list_tools()
         async def handle_list_tools() -> ListToolsResult:
             """사용 가능한 도구 목록 반환"""
-            return ListToolsResult(
-                tools=[
-                    Tool(
-                        name="subscribe_blocks",
-                        description="블록 정보를 구독합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="subscribe_mempool_blocks",
-                        description="멤풀 블록 정보를 구독합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="subscribe_stats",
-                        description="통계 정보를 구독합니다.",
-                        inputSchema={
-                            "type": "object", 
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="subscribe_live_chart",
-                        description="실시간 2시간 차트 데이터를 구독합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="track_address",
-                        description="특정 비트코인 주소를 추적합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "address": {
-                                    "type": "string",
-                                    "description": "추적할 비트코인 주소"
-                                }
-                            },
-                            "required": ["address"]
-                        }
-                    ),
-                    Tool(
-                        name="get_connection_status",
-                        description="WebSocket 연결 상태를 확인합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="unsubscribe_client",
-                        description="클라이언트의 모든 구독을 해제합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "client_id": {
-                                    "type": "string",
-                                    "description": "구독 해제할 클라이언트 ID"
-                                }
-                            },
-                            "required": ["client_id"]
-                        }
-                    ),
-                    Tool(
-                        name="get_address_info",
-                        description="주소 정보를 조회합니다 (잔액, 거래 수 등).",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "address": {
-                                    "type": "string",
-                                    "description": "조회할 비트코인 주소"
-                                }
-                            },
-                            "required": ["address"]
-                        }
-                    ),
-                    Tool(
-                        name="get_address_balance",
-                        description="주소의 잔액을 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "address": {
-                                    "type": "string",
-                                    "description": "조회할 비트코인 주소"
-                                }
-                            },
-                            "required": ["address"]
-                        }
-                    ),
-                    Tool(
-                        name="get_address_utxos",
-                        description="주소의 UTXO 목록을 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "address": {
-                                    "type": "string",
-                                    "description": "조회할 비트코인 주소"
-                                }
-                            },
-                            "required": ["address"]
-                        }
-                    ),
-                    Tool(
-                        name="get_address_transactions",
-                        description="주소의 거래 내역을 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "address": {
-                                    "type": "string",
-                                    "description": "조회할 비트코인 주소"
-                                },
-                                "after_txid": {
-                                    "type": "string",
-                                    "description": "이 트랜잭션 ID 이후의 거래들을 조회 (선택사항)",
-                                    "default": None
-                                }
-                            },
-                            "required": ["address"]
-                        }
-                    ),
-                    Tool(
-                        name="get_recommended_fees",
-                        description="추천 수수료를 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="get_mempool_info",
-                        description="멤풀 정보를 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="get_transaction_info",
-                        description="거래 정보를 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "txid": {
-                                    "type": "string",
-                                    "description": "조회할 거래 ID"
-                                }
-                            },
-                            "required": ["txid"]
-                        }
-                    ),
-                    Tool(
-                        name="get_block_info",
-                        description="블록 정보를 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "hash_or_height": {
-                                    "type": "string",
-                                    "description": "블록 해시 또는 높이"
-                                }
-                            },
-                            "required": ["hash_or_height"]
-                        }
-                    ),
-                    Tool(
-                        name="get_block_height",
-                        description="현재 블록 높이를 조회합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    ),
-                    Tool(
-                        name="validate_bitcoin_address",
-                        description="비트코인 주소가 유효한지 검증합니다.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "address": {
-                                    "type": "string",
-                                    "description": "검증할 비트코인 주소"
-                                }
-                            },
-                            "required": ["address"]
-                        }
-                    )
-                ]
-            )
+            return self._tools_result
 
         @self.server.call_tool()
-        async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """도구 호출 처리"""
+            log = logger.bind(tool=name)
             try:
                 # WebSocket 연결 확인 및 초기화
-                if not hasattr(ws_manager, '_ws') or ws_manager._ws is None:
+                if not ws_manager.is_connected:
                     await ws_manager.connect()
                 
-                if name == "subscribe_blocks":
-                    result = await self._subscribe_blocks()
-                elif name == "subscribe_mempool_blocks":
-                    result = await self._subscribe_mempool_blocks()
-                elif name == "subscribe_stats":
-                    result = await self._subscribe_stats()
-                elif name == "subscribe_live_chart":
-                    result = await self._subscribe_live_chart()
-                elif name == "track_address":
-                    result = await self._track_address(arguments["address"])
-                elif name == "get_connection_status":
-                    result = await self._get_connection_status()
-                elif name == "unsubscribe_client":
-                    result = await self._unsubscribe_client(arguments["client_id"])
-                elif name == "get_address_info":
-                    result = await self._get_address_info(arguments["address"])
-                elif name == "get_address_balance":
-                    result = await self._get_address_balance(arguments["address"])
-                elif name == "get_address_utxos":
-                    result = await self._get_address_utxos(arguments["address"])
-                elif name == "get_address_transactions":
-                    result = await self._get_address_transactions(
-                        arguments["address"], 
-                        arguments.get("after_txid")
-                    )
-                elif name == "get_recommended_fees":
-                    result = await self._get_recommended_fees()
-                elif name == "get_mempool_info":
-                    result = await self._get_mempool_info()
-                elif name == "get_transaction_info":
-                    result = await self._get_transaction_info(arguments["txid"])
-                elif name == "get_block_info":
-                    result = await self._get_block_info(arguments["hash_or_height"])
-                elif name == "get_block_height":
-                    result = await self._get_block_height()
-                elif name == "validate_bitcoin_address":
-                    result = await self._validate_bitcoin_address(arguments["address"])
-                else:
+                entry = self._dispatch.get(name)
+                if entry is None:
                     raise ValueError(f"Unknown tool: {name}")
+                handler, arg_type = entry
+                # 잘못된 인자는 도구 실행 전에 거부
+                args = msgspec.convert(arguments or {}, arg_type) if arg_type else None
+                result = await handler(args)
                 
-                return CallToolResult(
-                    content=[TextContent(type="text", text=result)]
-                )
+                # mcp 서버가 콘텐츠 목록을 CallToolResult로 감싸서 응답
+                return [TextContent(type="text", text=result)]
                 
             except Exception as e:
-                logger.error(f"Tool {name} failed", error=str(e))
-                return CallToolResult(
-                    content=[TextContent(type="text", text=json.dumps({"error": str(e)}))]
-                )
+                log.error("Tool failed", error=str(e))
+                return [TextContent(type="text", text=_error_json(str(e)))]
 
     # WebSocket 관련 메서드들
+    @_as_json_response
     async def _subscribe_blocks(self) -> str:
         """블록 정보를 구독합니다."""
-        try:
-            await ws_manager.connect()
-            client_id = str(uuid.uuid4())
-            await ws_manager.subscribe_channel(client_id, ChannelType.BLOCKS)
-            
-            # 최근 메시지들을 가져와서 반환
-            messages = []
-            try:
-                for _ in range(5):
-                    message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                    if self._is_block_message(message):
-                        messages.append(message)
-            except asyncio.TimeoutError:
-                pass
-            
-            result = {
-                "status": "subscribed",
-                "channel": ChannelType.BLOCKS,
-                "client_id": client_id,
-                "recent_messages": messages
-            }
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error("Failed to subscribe to blocks", error=str(e))
-            return json.dumps({"error": str(e)})
+        client_id = secrets.token_hex(8)
+        # 최근 메시지들을 가져와서 반환
+        messages = await self._collect(client_id, ChannelType.BLOCKS, 5)
+        
+        return _splice(
+            self._subscribed_prefixes[ChannelType.BLOCKS],
+            {"client_id": client_id, "recent_messages": messages}
+        )
 
+    @_as_json_response
     async def _subscribe_mempool_blocks(self) -> str:
         """멤풀 블록 정보를 구독합니다."""
-        try:
-            await ws_manager.connect()
-            client_id = str(uuid.uuid4())
-            await ws_manager.subscribe_channel(client_id, ChannelType.MEMPOOL_BLOCKS)
-            
-            messages = []
-            try:
-                for _ in range(5):
-                    message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                    if self._is_mempool_block_message(message):
-                        messages.append(message)
-            except asyncio.TimeoutError:
-                pass
-            
-            result = {
-                "status": "subscribed",
-                "channel": ChannelType.MEMPOOL_BLOCKS,
-                "client_id": client_id,
-                "recent_messages": messages
-            }
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error("Failed to subscribe to mempool blocks", error=str(e))
-            return json.dumps({"error": str(e)})
+        client_id = secrets.token_hex(8)
+        # 최근 메시지들을 가져와서 반환
+        messages = await self._collect(client_id, ChannelType.MEMPOOL_BLOCKS, 5)
+        
+        return _splice(
+            self._subscribed_prefixes[ChannelType.MEMPOOL_BLOCKS],
+            {"client_id": client_id, "recent_messages": messages}
+        )
 
+    @_as_json_response
     async def _subscribe_stats(self) -> str:
         """통계 정보를 구독합니다."""
-        try:
-            await ws_manager.connect()
-            client_id = str(uuid.uuid4())
-            await ws_manager.subscribe_channel(client_id, ChannelType.STATS)
-            
-            messages = []
-            try:
-                for _ in range(3):
-                    message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                    if self._is_stats_message(message):
-                        messages.append(message)
-            except asyncio.TimeoutError:
-                pass
-            
-            result = {
-                "status": "subscribed",
-                "channel": ChannelType.STATS,
-                "client_id": client_id,
-                "recent_messages": messages
-            }
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error("Failed to subscribe to stats", error=str(e))
-            return json.dumps({"error": str(e)})
+        client_id = secrets.token_hex(8)
+        # 최근 메시지들을 가져와서 반환
+        messages = await self._collect(client_id, ChannelType.STATS, 3)
+        
+        return _splice(
+            self._subscribed_prefixes[ChannelType.STATS],
+            {"client_id": client_id, "recent_messages": messages}
+        )
 
+    @_as_json_response
     async def _subscribe_live_chart(self) -> str:
         """실시간 2시간 차트 데이터를 구독합니다."""
-        try:
-            await ws_manager.connect()
-            client_id = str(uuid.uuid4())
-            await ws_manager.subscribe_channel(client_id, ChannelType.LIVE_2H_CHART)
-            
-            messages = []
-            try:
-                for _ in range(3):
-                    message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                    if self._is_chart_message(message):
-                        messages.append(message)
-            except asyncio.TimeoutError:
-                pass
-            
-            result = {
-                "status": "subscribed",
-                "channel": ChannelType.LIVE_2H_CHART,
-                "client_id": client_id,
-                "recent_messages": messages
-            }
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error("Failed to subscribe to live chart", error=str(e))
-            return json.dumps({"error": str(e)})
+        client_id = secrets.token_hex(8)
+        # 최근 메시지들을 가져와서 반환
+        messages = await self._collect(client_id, ChannelType.LIVE_2H_CHART, 3)
+        
+        return _splice(
+            self._subscribed_prefixes[ChannelType.LIVE_2H_CHART],
+            {"client_id": client_id, "recent_messages": messages}
+        )
 
-    async def _track_address(self, address: str) -> str:
+    @_as_json_response
+    async def _track_address(self, address: str) -> Dict[str, Any]:
         """특정 비트코인 주소를 추적합니다."""
-        try:
-            await ws_manager.connect()
-            client_id = str(uuid.uuid4())
-            await ws_manager.track_address(client_id, address)
-            
-            result = {
-                "status": "tracking",
-                "address": address,
-                "client_id": client_id,
-                "timestamp": datetime.now().isoformat()
-            }
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error("Failed to track address", error=str(e))
-            return json.dumps({"error": str(e)})
-
-    async def _get_connection_status(self) -> str:
+        client_id = secrets.token_hex(8)
+        await ws_manager.track_address(client_id, address)
+        
+        return {
+            "status": "tracking",
+            "address": address,
+            "client_id": client_id,
+            "timestamp": datetime.now()
+        }
+
+    @_as_json_response
+    async def _get_connection_status(self) -> Dict[str, Any]:
         """WebSocket 연결 상태를 확인합니다."""
-        try:
-            status = await ws_manager.get_connection_status()
-            return json.dumps(status, indent=2)
-        except Exception as e:
-            logger.error("Failed to get connection status", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await ws_manager.get_connection_status()
 
-    async def _unsubscribe_client(self, client_id: str) -> str:
+    @_as_json_response
+    async def _unsubscribe_client(self, client_id: str) -> Dict[str, Any]:
         """클라이언트의 모든 구독을 해제합니다."""
-        try:
-            await ws_manager.unsubscribe_client(client_id)
-            result = {
-                "status": "unsubscribed",
-                "client_id": client_id,
-                "timestamp": datetime.now().isoformat()
-            }
-            return json.dumps(result, indent=2)
-        except Exception as e:
-            logger.error("Failed to unsubscribe client", error=str(e))
-            return json.dumps({"error": str(e)})
+        await ws_manager.unsubscribe_client(client_id)
+        return {
+            "status": "unsubscribed",
+            "client_id": client_id,
+            "timestamp": datetime.now()
+        }
 
     # REST API 관련 메서드들
-    async def _get_address_info(self, address: str) -> str:
+    @_as_json_response
+    async def _get_address_info(self, address: str) -> Dict[str, Any]:
         """주소 정보를 조회합니다."""
-        try:
-            info = await rest_client.get_address_info(address)
-            return json.dumps(info, indent=2)
-        except Exception as e:
-            logger.error("Failed to get address info", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_address(address)
 
-    async def _get_address_balance(self, address: str) -> str:
+    @_as_json_response
+    async def _get_address_balance(self, address: str) -> Dict[str, Any]:
         """주소의 잔액을 조회합니다."""
-        try:
-            balance = await rest_client.get_address_balance(address)
-            return json.dumps(balance, indent=2)
-        except Exception as e:
-            logger.error("Failed to get address balance", error=str(e))
-            return json.dumps({"error": str(e)})
+        info = await rest_client.get_address(address)
+        chain = info.get("chain_stats", {})
+        mempool = info.get("mempool_stats", {})
+        confirmed = chain.get("funded_txo_sum", 0) - chain.get("spent_txo_sum", 0)
+        unconfirmed = mempool.get("funded_txo_sum", 0) - mempool.get("spent_txo_sum", 0)
+        return {
+            "address": address,
+            "balance": {
+                "confirmed": confirmed,
+                "unconfirmed": unconfirmed,
+                "total": confirmed + unconfirmed
+            },
+            "transactions": {
+                "confirmed": chain.get("tx_count", 0),
+                "unconfirmed": mempool.get("tx_count", 0)
+            }
+        }
 
-    async def _get_address_utxos(self, address: str) -> str:
+    @_as_json_response
+    async def _get_address_utxos(self, address: str) -> List[Dict[str, Any]]:
         """주소의 UTXO 목록을 조회합니다."""
-        try:
-            utxos = await rest_client.get_address_utxos(address)
-            return json.dumps(utxos, indent=2)
-        except Exception as e:
-            logger.error("Failed to get address UTXOs", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_address_utxo(address)
 
-    async def _get_address_transactions(self, address: str, after_txid: Optional[str] = None) -> str:
+    @_as_json_response
+    async def _get_address_transactions(self, address: str, after_txid: Optional[str] = None) -> List[Dict[str, Any]]:
         """주소의 거래 내역을 조회합니다."""
-        try:
-            transactions = await rest_client.get_address_transactions(address, after_txid)
-            return json.dumps(transactions, indent=2)
-        except Exception as e:
-            logger.error("Failed to get address transactions", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_address_txs(address, after_txid)
+
+    @_as_json_response
+    async def _get_address_bundle(self, address: str) -> Dict[str, Any]:
+        """주소 정보, UTXO, 거래 내역을 한 번에 조회합니다."""
+        return {"address": address, **await rest_client.get_address_full(address)}
 
-    async def _get_recommended_fees(self) -> str:
+    @_as_json_response
+    async def _get_recommended_fees(self) -> Dict[str, int]:
         """추천 수수료를 조회합니다."""
-        try:
-            fees = await rest_client.get_recommended_fees()
-            return json.dumps(fees, indent=2)
-        except Exception as e:
-            logger.error("Failed to get recommended fees", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_fees_recommended()
 
-    async def _get_mempool_info(self) -> str:
+    @_as_json_response
+    async def _get_mempool_info(self) -> Dict[str, Any]:
         """멤풀 정보를 조회합니다."""
-        try:
-            info = await rest_client.get_mempool_info()
-            return json.dumps(info, indent=2)
-        except Exception as e:
-            logger.error("Failed to get mempool info", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_mempool()
 
-    async def _get_transaction_info(self, txid: str) -> str:
+    @_as_json_response
+    async def _get_transaction_info(self, txid: str) -> Dict[str, Any]:
         """거래 정보를 조회합니다."""
-        try:
-            info = await rest_client.get_transaction_info(txid)
-            return json.dumps(info, indent=2)
-        except Exception as e:
-            logger.error("Failed to get transaction info", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_tx(txid)
 
-    async def _get_block_info(self, hash_or_height: str) -> str:
+    @_as_json_response
+    async def _get_block_info(self, hash_or_height: str) -> Dict[str, Any]:
         """블록 정보를 조회합니다."""
-        try:
-            info = await rest_client.get_block_info(hash_or_height)
-            return json.dumps(info, indent=2)
-        except Exception as e:
-            logger.error("Failed to get block info", error=str(e))
-            return json.dumps({"error": str(e)})
+        return await rest_client.get_block(hash_or_height)
 
-    async def _get_block_height(self) -> str:
+    @_as_json_response
+    async def _get_block_height(self) -> Dict[str, Any]:
         """현재 블록 높이를 조회합니다."""
-        try:
-            height = await rest_client.get_block_height()
-            return json.dumps({"block_height": height}, indent=2)
-        except Exception as e:
-            logger.error("Failed to get block height", error=str(e))
-            return json.dumps({"error": str(e)})
+        return {"block_height": await rest_client.get_blocks_tip_height()}
 
-    async def _validate_bitcoin_address(self, address: str) -> str:
+    @_as_json_response
+    async def _validate_bitcoin_address(self, address: str) -> Dict[str, Any]:
         """비트코인 주소가 유효한지 검증합니다."""
-        try:
-            is_valid = await rest_client.validate_bitcoin_address(address)
-            return json.dumps({"address": address, "is_valid": is_valid}, indent=2)
-        except Exception as e:
-            logger.error("Failed to validate bitcoin address", error=str(e))
-            return json.dumps({"error": str(e)})
+        result = await rest_client.validate_address(address)
+        return {"address": address, "is_valid": result.get("isvalid", False)}
 
     # 헬퍼 메서드들
-    def _is_block_message(self, message: Dict[str, Any]) -> bool:
-        """블록 메시지인지 확인."""
-        return "block" in message or "height" in message
-
-    def _is_mempool_block_message(self, message: Dict[str, Any]) -> bool:
-        """멤풀 블록 메시지인지 확인."""
-        return "mempool-blocks" in str(message) or "nTx" in message
-
-    def _is_stats_message(self, message: Dict[str, Any]) -> bool:
-        """통계 메시지인지 확인."""
-        return "mempool" in message and "vsize" in str(message)
-
-    def _is_chart_message(self, message: Dict[str, Any]) -> bool:
-        """차트 메시지인지 확인."""
-        return "chart" in str(message) or "prices" in str(message)
-
-    async def run(self):
-        """서버 실행"""
-        # WebSocket 초기화
+    async def _collect(
+        self,
+        client_id: str,
+        channel: str,
+        n: int,
+        total_timeout: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """채널 리스너를 등록하고 구독한 뒤 최대 n개 메시지를 반환 (첫 메시지만 대기)."""
+        listener = MessageListener()
+        await ws_manager.add_listener(channel, listener)
+        try:
+            await ws_manager.subscribe_channel(client_id, channel)
+            try:
+                # 한 번 깨어날 때 이미 쌓인 메시지를 모두 가져옴
+                async with asyncio.timeout(total_timeout):
+                    return (await listener.get_batch())[:n]
+            except TimeoutError:
+                return []
+        finally:
+            await ws_manager.remove_listener(channel, listener)
+
+    async def _connect_websocket(self) -> None:
+        """WebSocket 초기화 (실패해도 서버는 계속 실행)."""
         try:
             await ws_manager.connect()
             logger.info("WebSocket connection established")
         except Exception as e:
             logger.error("Failed to initialize WebSocket", error=str(e))
-        
-        # STDIO 서버 실행
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="mempool-ws-mcp-server",
-                    server_version="1.0.0",
-                    capabilities=ServerCapabilities(
-                        tools={},
-                        resources={},
-                        prompts={}
+
+    async def run(self):
+        """서버 실행"""
+        async with asyncio.TaskGroup() as tg:
+            # WebSocket 핸드셰이크를 STDIO 서버 초기화와 병행
+            # (첫 도구 호출은 connect()의 잠금에서 연결 완료를 기다림)
+            tg.create_task(self._connect_websocket())
+
+            # STDIO 서버 실행
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="mempool-ws-mcp-server",
+                        server_version="1.0.0",
+                        capabilities=ServerCapabilities(
+                            tools={},
+                            resources={},
+                            prompts={}
+                        )
                     )
                 )
-            )
 
 
 def main():
@@ -632,6 +637,9 @@ def main():
     try:
         server = MempoolMCPServer()
         logger.info("Starting standard MCP server in STDIO mode")
+        # asyncio.run이 uvloop 루프를 생성하도록 정책 설치
+        if uvloop is not None:
+            uvloop.install()
         asyncio.run(server.run())
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
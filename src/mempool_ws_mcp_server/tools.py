@@ -1,16 +1,19 @@
 """FastMCP 도구 정의."""
 
 import asyncio
-import json
-import uuid
+import secrets
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
 import structlog
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
 
+from .config import config
 from .types import ChannelType, BlockData, MempoolStats, TrackAddressMessage
-from .websocket_manager import WebSocketManager
+from .websocket_manager import MessageListener, WebSocketManager
 from .rest_client import rest_client
 
 logger = structlog.get_logger(__name__)
@@ -21,153 +24,164 @@ ws_manager = WebSocketManager()
 # FastMCP 서버 인스턴스
 mcp = FastMCP("Mempool WebSocket MCP Server")
 
+# 도구 목록 캐시 유효 시간 (초) - 도구는 import 시점에 등록되어 사실상 정적
+LIST_TOOLS_CACHE_TTL = 30.0
+
+
+class ListToolsCacheMiddleware(Middleware):
+    """tools/list 결과를 TTL 동안 재사용하는 미들웨어 (클라이언트 폴링마다 목록을 다시 만들지 않음)."""
+
+    def __init__(self, ttl: float = LIST_TOOLS_CACHE_TTL) -> None:
+        """초기화."""
+        self.ttl = ttl
+        self._tools: Optional[list] = None
+        self._expires_at = 0.0
+
+    async def on_list_tools(self, context, call_next):
+        """캐시가 유효하면 그대로 반환하고, 아니면 목록을 새로 만들어 저장."""
+        now = time.monotonic()
+        if self._tools is None or now >= self._expires_at:
+            self._tools = await call_next(context)
+            self._expires_at = now + self.ttl
+        return self._tools
+
+
+list_tools_cache = ListToolsCacheMiddleware()
+mcp.add_middleware(list_tools_cache)
+
+
+# MCP_PRETTY_JSON이 켜진 경우에만 들여쓰기 (기본은 압축 출력)
+_DUMPS_OPTION = orjson.OPT_INDENT_2 if config.PRETTY_JSON else 0
+
+
+def _dumps(obj: Any) -> str:
+    """도구 응답을 orjson으로 직렬화합니다."""
+    return orjson.dumps(obj, option=_DUMPS_OPTION).decode()
+
+
+def _json_prefix(static: Dict[str, Any]) -> bytes:
+    """고정 필드를 미리 직렬화하고 닫는 괄호를 제거한 접두부를 만듭니다."""
+    return orjson.dumps(static, option=_DUMPS_OPTION)[:-1].rstrip(b"\n")
+
+
+def _splice(prefix: bytes, dynamic: Dict[str, Any]) -> str:
+    """미리 직렬화한 접두부 뒤에 동적 필드를 이어 붙입니다."""
+    return (prefix + b"," + orjson.dumps(dynamic, option=_DUMPS_OPTION)[1:]).decode()
+
+
+# 구독 응답의 고정 부분 (status, channel)은 채널별로 한 번만 직렬화
+_SUBSCRIBED_PREFIXES = {
+    channel: _json_prefix({"status": "subscribed", "channel": channel})
+    for channel in (
+        ChannelType.BLOCKS,
+        ChannelType.MEMPOOL_BLOCKS,
+        ChannelType.STATS,
+        ChannelType.LIVE_2H_CHART,
+    )
+}
+
+
 @mcp.tool
 async def subscribe_blocks() -> str:
     """블록 정보를 구독합니다."""
     try:
         await ws_manager.connect()
-        client_id = str(uuid.uuid4())
-        await ws_manager.subscribe_channel(client_id, ChannelType.BLOCKS)
-        
-        # 최근 메시지들을 가져와서 반환
-        messages = []
-        try:
-            # 큐에서 최대 5개 메시지 수집 (타임아웃 5초)
-            for _ in range(5):
-                message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                if _is_block_message(message):
-                    messages.append(message)
-        except asyncio.TimeoutError:
-            pass
+        client_id = secrets.token_hex(8)
+        # 채널 전용 리스너 큐로 최근 메시지 수집
+        messages = await _subscribe_and_collect(client_id, ChannelType.BLOCKS, 5)
         
-        result = {
-            "status": "subscribed",
-            "channel": ChannelType.BLOCKS,
-            "client_id": client_id,
-            "recent_messages": messages
-        }
-        return json.dumps(result, indent=2)
+        return _splice(
+            _SUBSCRIBED_PREFIXES[ChannelType.BLOCKS],
+            {"client_id": client_id, "recent_messages": messages}
+        )
         
     except Exception as e:
         logger.error("Failed to subscribe to blocks", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def subscribe_mempool_blocks() -> str:
     """멤풀 블록 정보를 구독합니다."""
     try:
         await ws_manager.connect()
-        client_id = str(uuid.uuid4())
-        await ws_manager.subscribe_channel(client_id, ChannelType.MEMPOOL_BLOCKS)
+        client_id = secrets.token_hex(8)
+        # 채널 전용 리스너 큐로 최근 메시지 수집
+        messages = await _subscribe_and_collect(client_id, ChannelType.MEMPOOL_BLOCKS, 5)
         
-        messages = []
-        try:
-            for _ in range(5):
-                message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                if _is_mempool_block_message(message):
-                    messages.append(message)
-        except asyncio.TimeoutError:
-            pass
-        
-        result = {
-            "status": "subscribed",
-            "channel": ChannelType.MEMPOOL_BLOCKS,
-            "client_id": client_id,
-            "recent_messages": messages
-        }
-        return json.dumps(result, indent=2)
+        return _splice(
+            _SUBSCRIBED_PREFIXES[ChannelType.MEMPOOL_BLOCKS],
+            {"client_id": client_id, "recent_messages": messages}
+        )
         
     except Exception as e:
         logger.error("Failed to subscribe to mempool blocks", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def subscribe_stats() -> str:
     """통계 정보를 구독합니다."""
     try:
         await ws_manager.connect()
-        client_id = str(uuid.uuid4())
-        await ws_manager.subscribe_channel(client_id, ChannelType.STATS)
-        
-        messages = []
-        try:
-            for _ in range(3):
-                message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                if _is_stats_message(message):
-                    messages.append(message)
-        except asyncio.TimeoutError:
-            pass
+        client_id = secrets.token_hex(8)
+        # 채널 전용 리스너 큐로 최근 메시지 수집
+        messages = await _subscribe_and_collect(client_id, ChannelType.STATS, 3)
         
-        result = {
-            "status": "subscribed",
-            "channel": ChannelType.STATS,
-            "client_id": client_id,
-            "recent_messages": messages
-        }
-        return json.dumps(result, indent=2)
+        return _splice(
+            _SUBSCRIBED_PREFIXES[ChannelType.STATS],
+            {"client_id": client_id, "recent_messages": messages}
+        )
         
     except Exception as e:
         logger.error("Failed to subscribe to stats", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def subscribe_live_chart() -> str:
     """실시간 2시간 차트 데이터를 구독합니다."""
     try:
         await ws_manager.connect()
-        client_id = str(uuid.uuid4())
-        await ws_manager.subscribe_channel(client_id, ChannelType.LIVE_2H_CHART)
-        
-        messages = []
-        try:
-            for _ in range(3):
-                message = await asyncio.wait_for(ws_manager.message_queue.get(), timeout=1.0)
-                if _is_chart_message(message):
-                    messages.append(message)
-        except asyncio.TimeoutError:
-            pass
+        client_id = secrets.token_hex(8)
+        # 채널 전용 리스너 큐로 최근 메시지 수집
+        messages = await _subscribe_and_collect(client_id, ChannelType.LIVE_2H_CHART, 3)
         
-        result = {
-            "status": "subscribed",
-            "channel": ChannelType.LIVE_2H_CHART,
-            "client_id": client_id,
-            "recent_messages": messages
-        }
-        return json.dumps(result, indent=2)
+        return _splice(
+            _SUBSCRIBED_PREFIXES[ChannelType.LIVE_2H_CHART],
+            {"client_id": client_id, "recent_messages": messages}
+        )
         
     except Exception as e:
         logger.error("Failed to subscribe to live chart", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def track_address(address: str) -> str:
     """특정 비트코인 주소를 추적합니다."""
     try:
         await ws_manager.connect()
-        client_id = str(uuid.uuid4())
+        client_id = secrets.token_hex(8)
         await ws_manager.track_address(client_id, address)
         
         result = {
             "status": "tracking",
             "address": address,
             "client_id": client_id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
-        return json.dumps(result, indent=2)
+        return _dumps(result)
         
     except Exception as e:
         logger.error("Failed to track address", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_connection_status() -> str:
     """WebSocket 연결 상태를 확인합니다."""
     try:
         status = await ws_manager.get_connection_status()
-        return json.dumps(status, indent=2)
+        return _dumps(status)
     except Exception as e:
         logger.error("Failed to get connection status", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def unsubscribe_client(client_id: str) -> str:
@@ -177,30 +191,40 @@ async def unsubscribe_client(client_id: str) -> str:
         result = {
             "status": "unsubscribed",
             "client_id": client_id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to unsubscribe client", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 # 헬퍼 함수들
-def _is_block_message(message: Dict[str, Any]) -> bool:
-    """블록 메시지인지 확인."""
-    return "block" in message or "height" in message
-
-def _is_mempool_block_message(message: Dict[str, Any]) -> bool:
-    """멤풀 블록 메시지인지 확인."""
-    return "mempool-blocks" in str(message) or "nTx" in message
-
-def _is_stats_message(message: Dict[str, Any]) -> bool:
-    """통계 메시지인지 확인."""
-    return "mempool" in message and "vsize" in str(message)
-
-def _is_chart_message(message: Dict[str, Any]) -> bool:
-    """차트 메시지인지 확인."""
-    return "live" in str(message) or "chart" in str(message)
+async def _subscribe_and_collect(
+    client_id: str,
+    channel: str,
+    count: int,
+    total_timeout: float = 5.0
+) -> List[Dict[str, Any]]:
+    """채널 리스너를 등록하고 구독한 뒤 해당 채널 메시지만 최대 count개 수집."""
+    listener = MessageListener()
+    await ws_manager.add_listener(channel, listener)
+    try:
+        await ws_manager.subscribe_channel(client_id, channel)
+        
+        # 메시지마다 wait_for 타이머를 만들지 않고 전체 수집에 하나의 제한 시간 적용
+        # (한 번 깨어날 때 쌓인 메시지를 모두 가져옴)
+        messages = []
+        try:
+            async with asyncio.timeout(total_timeout):
+                while len(messages) < count:
+                    messages.extend(await listener.get_batch())
+        except TimeoutError:
+            pass
+        return messages[:count]
+    finally:
+        # 느린 클라이언트가 리스너를 남기지 않도록 항상 제거
+        await ws_manager.remove_listener(channel, listener)
 
 
 # ========================================
@@ -212,33 +236,36 @@ async def get_address_info(address: str) -> str:
     """주소 정보를 조회합니다 (잔액, 거래 수 등)."""
     try:
         result = await rest_client.get_address(address)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to get address info", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_address_balance(address: str) -> str:
     """주소의 잔액을 조회합니다."""
     try:
         result = await rest_client.get_address(address)
+        chain_stats = result.get("chain_stats") or {}
+        mempool_stats = result.get("mempool_stats") or {}
+        confirmed = chain_stats.get("funded_txo_sum", 0) - chain_stats.get("spent_txo_sum", 0)
+        unconfirmed = mempool_stats.get("funded_txo_sum", 0) - mempool_stats.get("spent_txo_sum", 0)
         balance_info = {
             "address": address,
             "balance": {
-                "confirmed": result.get("chain_stats", {}).get("funded_txo_sum", 0) - result.get("chain_stats", {}).get("spent_txo_sum", 0),
-                "unconfirmed": result.get("mempool_stats", {}).get("funded_txo_sum", 0) - result.get("mempool_stats", {}).get("spent_txo_sum", 0),
-                "total": (result.get("chain_stats", {}).get("funded_txo_sum", 0) - result.get("chain_stats", {}).get("spent_txo_sum", 0)) + 
-                        (result.get("mempool_stats", {}).get("funded_txo_sum", 0) - result.get("mempool_stats", {}).get("spent_txo_sum", 0))
+                "confirmed": confirmed,
+                "unconfirmed": unconfirmed,
+                "total": confirmed + unconfirmed
             },
             "transactions": {
-                "confirmed": result.get("chain_stats", {}).get("tx_count", 0),
-                "unconfirmed": result.get("mempool_stats", {}).get("tx_count", 0)
+                "confirmed": chain_stats.get("tx_count", 0),
+                "unconfirmed": mempool_stats.get("tx_count", 0)
             }
         }
-        return json.dumps(balance_info, indent=2)
+        return _dumps(balance_info)
     except Exception as e:
         logger.error("Failed to get address balance", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_address_utxos(address: str) -> str:
@@ -251,10 +278,10 @@ async def get_address_utxos(address: str) -> str:
             "total_value": sum(utxo.get("value", 0) for utxo in result),
             "utxos": result
         }
-        return json.dumps(utxo_info, indent=2)
+        return _dumps(utxo_info)
     except Exception as e:
         logger.error("Failed to get address UTXOs", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_address_transactions(address: str, after_txid: str = None) -> str:
@@ -266,70 +293,80 @@ async def get_address_transactions(address: str, after_txid: str = None) -> str:
             "transaction_count": len(result),
             "transactions": result
         }
-        return json.dumps(tx_info, indent=2)
+        return _dumps(tx_info)
     except Exception as e:
         logger.error("Failed to get address transactions", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
+
+@mcp.tool
+async def get_address_bundle(address: str) -> str:
+    """주소 정보, UTXO, 거래 내역을 한 번에 조회합니다."""
+    try:
+        result = await rest_client.get_address_full(address)
+        return _dumps({"address": address, **result})
+    except Exception as e:
+        logger.error("Failed to get address bundle", error=str(e))
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_recommended_fees() -> str:
     """추천 수수료를 조회합니다."""
     try:
         result = await rest_client.get_fees_recommended()
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to get recommended fees", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_mempool_info() -> str:
     """멤풀 정보를 조회합니다."""
     try:
         result = await rest_client.get_mempool()
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to get mempool info", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_transaction_info(txid: str) -> str:
     """거래 정보를 조회합니다."""
     try:
         result = await rest_client.get_tx(txid)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to get transaction info", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_block_info(hash_or_height: str) -> str:
     """블록 정보를 조회합니다."""
     try:
         result = await rest_client.get_block(hash_or_height)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to get block info", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def get_block_height() -> str:
     """현재 블록 높이를 조회합니다."""
     try:
         result = await rest_client.get_blocks_tip_height()
-        return json.dumps({"current_height": result}, indent=2)
+        return _dumps({"current_height": result})
     except Exception as e:
         logger.error("Failed to get block height", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 @mcp.tool
 async def validate_bitcoin_address(address: str) -> str:
     """비트코인 주소가 유효한지 검증합니다."""
     try:
         result = await rest_client.validate_address(address)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except Exception as e:
         logger.error("Failed to validate address", error=str(e))
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 async def initialize_websocket():
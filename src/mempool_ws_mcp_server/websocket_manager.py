@@ -1,22 +1,91 @@
 """WebSocket 연결 관리자."""
 
 import asyncio
-import json
+import functools
 import time
-from typing import Any, Dict, List, Optional, Set
+from collections import defaultdict, deque
+from typing import Any, DefaultDict, Dict, FrozenSet, List, Optional, Set, Union
 from urllib.parse import urlparse
 
+import orjson
 import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from .config import config
-from .types import ChannelType, WebSocketMessage, TrackAddressMessage
+from .rest_client import rest_client
+from .types import ChannelType
 
 
 logger = structlog.get_logger(__name__)
 
+# 같은 이벤트 루프 틱에 들어온 구독/해제 요청을 하나의 want 메시지로 병합 (0이면 한 틱만 양보)
+WANT_COALESCE_DELAY = 0
+
+# 이벤트 루프 지연 측정 주기 (초)
+LOOP_LAG_INTERVAL = 0.05
+
+# 하트비트 주기, 연결 대기 간격, 재연결 최대 백오프 (초)
+HEARTBEAT_INTERVAL = 30
+IDLE_RECV_DELAY = 1
+RECONNECT_MAX_BACKOFF = 60
+
+# 리스너 버퍼 최대 크기 - 느린 소비자로 인한 메모리 증가 방지 (넘치면 오래된 메시지부터 버림)
+LISTENER_MAX_BUFFER = 512
+
+# 메시지 최상위 키 -> 채널 (삽입 순서가 여러 키가 함께 올 때의 우선순위)
+_CHANNEL_BY_KEY: Dict[str, str] = {
+    "block": ChannelType.BLOCKS,
+    "mempool-blocks": ChannelType.MEMPOOL_BLOCKS,
+    "mempoolInfo": ChannelType.STATS,
+    "live-2h-chart": ChannelType.LIVE_2H_CHART,
+    "address": ChannelType.TRACK_ADDRESS,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _want_frame(channels: FrozenSet[str]) -> str:
+    """채널 집합에 대한 want 프레임을 미리 직렬화 (채널 조합이 적어 캐시 적중률이 높음)."""
+    return orjson.dumps({"action": "want", "data": sorted(channels)}).decode()
+
+
+class MessageListener:
+    """채널 메시지 리스너 (deque 버퍼 + 대기 Future)."""
+
+    __slots__ = ("_buffer", "_waiter", "_dropped")
+
+    def __init__(self, maxlen: int = LISTENER_MAX_BUFFER) -> None:
+        """초기화 (maxlen을 넘으면 가장 오래된 메시지부터 버림)."""
+        self._buffer: deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._dropped = 0
+
+    def push(self, data: Dict[str, Any]) -> None:
+        """메시지를 버퍼에 추가하고 대기 중인 소비자를 깨움."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append(data)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get_batch(self) -> List[Dict[str, Any]]:
+        """메시지가 올 때까지 기다린 뒤 쌓인 메시지를 한 번에 모두 반환."""
+        while not self._buffer:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        batch = list(self._buffer)
+        self._buffer.clear()
+        if self._dropped:
+            # 버려진 메시지가 있으면 소비자가 알 수 있도록 배치 맨 앞에 표시
+            batch.insert(0, {"type": "overflow", "dropped": self._dropped})
+            self._dropped = 0
+        return batch
+
 
 class WebSocketManager:
     """Mempool WebSocket 연결 관리자."""
@@ -25,17 +94,20 @@ class WebSocketManager:
         """초기화."""
         self.ws_url = ws_url or config.MEMPOOL_WS_URL
         self.websocket: Optional[websockets.WebSocketServerProtocol] = None
-        self.subscriptions: Dict[str, Set[str]] = {}  # client_id -> channels
-        self.channel_subscribers: Dict[str, Set[str]] = {}  # channel -> client_ids
-        self.message_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(
-            maxsize=config.MAX_MESSAGE_QUEUE_SIZE
-        )
+        self.subscriptions: DefaultDict[str, Set[str]] = defaultdict(set)  # client_id -> channels
+        self.channel_subscribers: DefaultDict[str, Set[str]] = defaultdict(set)  # channel -> client_ids
         self.connection_lock = asyncio.Lock()
         self.is_connected = False
         self.last_ping = time.time()
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = config.WS_MAX_RECONNECT_ATTEMPTS
-        self._listeners: Dict[str, List[asyncio.Queue[Dict[str, Any]]]] = {}
+        self._listeners: DefaultDict[str, List[MessageListener]] = defaultdict(list)
+        self._want_event = asyncio.Event()
+        self._want_task: Optional[asyncio.Task[None]] = None
+        # 수신/하트비트 태스크 참조 (GC 방지 및 해제 시 취소용)
+        self._tasks: Set[asyncio.Task[None]] = set()
+        # 최근 측정한 이벤트 루프 지연 (ms) - 블로킹 핸들러 감지용, 감시 태스크가 없으면 None
+        self._loop_lag_ms: Optional[float] = None
 
     async def connect(self) -> None:
         """WebSocket 연결 설정."""
@@ -51,23 +123,57 @@ class WebSocketManager:
                     ping_interval=config.WS_PING_INTERVAL,
                     ping_timeout=config.WS_PING_TIMEOUT,
                     close_timeout=10,
+                    # 대역폭보다 CPU가 병목이므로 기본적으로 deflate 압축 해제 비용을 없앰
+                    compression="deflate" if config.WS_COMPRESSION else None,
+                    max_size=config.WS_MAX_SIZE,
+                    # read_limit은 레거시 클라이언트(websockets 11)에만 있으므로 write_limit만 지정
+                    write_limit=2 ** 18,
                 )
                 self.is_connected = True
                 self.reconnect_attempts = 0
                 logger.info("Successfully connected to WebSocket")
 
                 # 백그라운드 태스크 시작
-                asyncio.create_task(self._message_handler())
-                asyncio.create_task(self._heartbeat())
+                self._start_background_tasks()
 
             except Exception as e:
                 logger.error("Failed to connect to WebSocket", error=str(e))
                 self.is_connected = False
                 raise
 
+            # 재연결을 누가 시작했든 (수신 태스크, 도구 호출, 전송) 기존 구독은 항상 복원
+            restore = bool(self.channel_subscribers)
+
+        # _send_message가 다시 connect를 호출할 수 있으므로 락 밖에서 복원
+        if restore:
+            try:
+                await self._restore_subscriptions()
+            except Exception as e:
+                logger.error("Failed to restore subscriptions", error=str(e))
+
+    def _start_background_tasks(self) -> None:
+        """수신/하트비트 태스크 시작 (재연결 시 이전 태스크는 취소)."""
+        # 재연결은 이전 수신 태스크 안에서 일어나므로 자기 자신은 취소하지 않음
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        self._tasks = {
+            asyncio.create_task(self._message_handler(), name="ws-reader"),
+            asyncio.create_task(self._heartbeat(), name="ws-heartbeat"),
+        }
+
     async def disconnect(self) -> None:
         """WebSocket 연결 해제."""
         async with self.connection_lock:
+            if self._want_task is not None:
+                self._want_task.cancel()
+                self._want_task = None
+            tasks = [task for task in self._tasks if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks.clear()
             if self.websocket:
                 await self.websocket.close()
                 self.websocket = None
@@ -79,13 +185,15 @@ class WebSocketManager:
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
     )
-    async def _send_message(self, message: Dict[str, Any]) -> None:
-        """메시지 전송."""
+    async def _send_message(self, message: Union[Dict[str, Any], str]) -> None:
+        """메시지 전송 (미리 직렬화된 str 프레임은 그대로 전송)."""
         if not self.websocket or not self.is_connected:
             await self.connect()
 
         try:
-            await self.websocket.send(json.dumps(message))
+            # 바이너리 프레임이 아닌 텍스트 프레임으로 전송
+            frame = message if isinstance(message, str) else orjson.dumps(message).decode()
+            await self.websocket.send(frame)
             logger.debug("Sent message", message=message)
         except ConnectionClosed:
             logger.warning("WebSocket connection closed, attempting to reconnect")
@@ -97,50 +205,73 @@ class WebSocketManager:
         logger.info("Subscribing to channel", client_id=client_id, channel=channel)
 
         # 클라이언트 구독 정보 업데이트
-        if client_id not in self.subscriptions:
-            self.subscriptions[client_id] = set()
         self.subscriptions[client_id].add(channel)
 
         # 채널 구독자 정보 업데이트
-        if channel not in self.channel_subscribers:
-            self.channel_subscribers[channel] = set()
-        self.channel_subscribers[channel].add(client_id)
-
-        # 새 채널인 경우 WebSocket에 구독 요청
-        if len(self.channel_subscribers[channel]) == 1:
-            if channel == ChannelType.TRACK_ADDRESS:
-                # 주소 추적은 별도 처리
-                return
-            
-            message = WebSocketMessage(action="want", data=[channel])
-            await self._send_message(message.model_dump())
+        subscribers = self.channel_subscribers[channel]
+        subscribers.add(client_id)
+
+        # 새 채널인 경우 WebSocket에 구독 요청 (주소 추적은 별도 처리)
+        if len(subscribers) == 1 and not self._is_track_channel(channel):
+            self._schedule_want()
 
     async def unsubscribe_channel(self, client_id: str, channel: str) -> None:
         """채널 구독 해제."""
         logger.info("Unsubscribing from channel", client_id=client_id, channel=channel)
 
-        # 클라이언트 구독 정보 업데이트
-        if client_id in self.subscriptions:
-            self.subscriptions[client_id].discard(channel)
-            if not self.subscriptions[client_id]:
+        # 클라이언트 구독 정보 업데이트 (조회만으로 빈 항목이 생기지 않도록 get 사용)
+        channels = self.subscriptions.get(client_id)
+        if channels is not None:
+            channels.discard(channel)
+            if not channels:
                 del self.subscriptions[client_id]
 
         # 채널 구독자 정보 업데이트
-        if channel in self.channel_subscribers:
-            self.channel_subscribers[channel].discard(client_id)
-            if not self.channel_subscribers[channel]:
+        subscribers = self.channel_subscribers.get(channel)
+        if subscribers is not None:
+            subscribers.discard(client_id)
+            if not subscribers:
                 del self.channel_subscribers[channel]
-                # 구독자가 없으면 WebSocket에서 구독 해제
-                if channel != ChannelType.TRACK_ADDRESS:
-                    message = WebSocketMessage(action="want", data=[])
-                    await self._send_message(message.model_dump())
+                # 구독자가 없으면 남은 채널만 다시 요청해 WebSocket에서 구독 해제
+                if not self._is_track_channel(channel):
+                    self._schedule_want()
+
+    @staticmethod
+    def _is_track_channel(channel: str) -> bool:
+        """주소 추적 채널인지 확인."""
+        return channel.startswith(ChannelType.TRACK_ADDRESS)
+
+    def _wanted_channels(self) -> FrozenSet[str]:
+        """want 메시지로 요청할 현재 구독 채널 집합."""
+        return frozenset(
+            channel for channel in self.channel_subscribers
+            if not self._is_track_channel(channel)
+        )
+
+    def _schedule_want(self) -> None:
+        """현재 구독 채널 전체를 담은 want 메시지 전송을 예약."""
+        self._want_event.set()
+        if self._want_task is None or self._want_task.done():
+            self._want_task = asyncio.create_task(self._want_writer())
+
+    async def _want_writer(self) -> None:
+        """예약된 want 요청을 모아 한 번에 전송하는 단일 writer."""
+        while True:
+            await self._want_event.wait()
+            # mempool.space의 want는 전체 채널 집합을 대체하므로 마지막 상태만 보내면 됨
+            await asyncio.sleep(WANT_COALESCE_DELAY)
+            self._want_event.clear()
+            try:
+                await self._send_message(_want_frame(self._wanted_channels()))
+            except Exception as e:
+                logger.error("Failed to send want message", error=str(e))
 
     async def track_address(self, client_id: str, address: str) -> None:
         """주소 추적."""
         logger.info("Tracking address", client_id=client_id, address=address)
         
-        message = TrackAddressMessage(track_address=address)
-        await self._send_message(message.model_dump())
+        # 내부 전송 메시지는 Pydantic 모델을 거치지 않고 dict로 직접 구성
+        await self._send_message({"track_address": address})
         
         # 클라이언트 구독 정보에 추가
         await self.subscribe_channel(client_id, f"track-address:{address}")
@@ -149,23 +280,32 @@ class WebSocketManager:
         """클라이언트의 모든 구독 해제."""
         logger.info("Unsubscribing client", client_id=client_id)
         
-        if client_id in self.subscriptions:
-            channels = list(self.subscriptions[client_id])
-            for channel in channels:
-                await self.unsubscribe_channel(client_id, channel)
+        # 해당 클라이언트의 채널만 순회하며 집합에서 바로 제거 (전체 구독 정보 재구성 없음)
+        resubscribe = False
+        for channel in self.subscriptions.pop(client_id, ()):
+            subscribers = self.channel_subscribers.get(channel)
+            if subscribers is None:
+                continue
+            subscribers.discard(client_id)
+            if not subscribers:
+                del self.channel_subscribers[channel]
+                resubscribe = resubscribe or not self._is_track_channel(channel)
+        
+        # 비워진 채널이 있으면 남은 채널 전체를 담은 want 한 번으로 구독 해제
+        if resubscribe:
+            self._schedule_want()
 
-    async def add_listener(self, channel: str, queue: asyncio.Queue[Dict[str, Any]]) -> None:
+    async def add_listener(self, channel: str, listener: MessageListener) -> None:
         """채널 리스너 추가."""
-        if channel not in self._listeners:
-            self._listeners[channel] = []
-        self._listeners[channel].append(queue)
+        self._listeners[channel].append(listener)
 
-    async def remove_listener(self, channel: str, queue: asyncio.Queue[Dict[str, Any]]) -> None:
+    async def remove_listener(self, channel: str, listener: MessageListener) -> None:
         """채널 리스너 제거."""
-        if channel in self._listeners:
+        listeners = self._listeners.get(channel)
+        if listeners is not None:
             try:
-                self._listeners[channel].remove(queue)
-                if not self._listeners[channel]:
+                listeners.remove(listener)
+                if not listeners:
                     del self._listeners[channel]
             except ValueError:
                 pass
@@ -175,17 +315,14 @@ class WebSocketManager:
         while self.is_connected:
             try:
                 if not self.websocket:
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(IDLE_RECV_DELAY)
                     continue
 
                 message = await self.websocket.recv()
-                data = json.loads(message)
+                data = orjson.loads(message)
                 
                 logger.debug("Received message", data=data)
                 
-                # 메시지를 큐에 추가
-                await self.message_queue.put(data)
-                
                 # 리스너들에게 메시지 전달
                 await self._distribute_message(data)
 
@@ -194,7 +331,7 @@ class WebSocketManager:
                 self.is_connected = False
                 await self._handle_reconnect()
                 break
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Failed to decode message", error=str(e))
             except Exception as e:
                 logger.error("Unexpected error in message handler", error=str(e))
@@ -204,27 +341,28 @@ class WebSocketManager:
         # 메시지 타입에 따라 적절한 채널 결정
         channel = self._determine_channel(data)
         
-        if channel and channel in self._listeners:
-            for queue in self._listeners[channel]:
-                try:
-                    await queue.put(data)
-                except asyncio.QueueFull:
-                    logger.warning("Queue full, dropping message", channel=channel)
+        # 새 블록이 오면 REST 팁/수수료 캐시는 더 이상 유효하지 않음
+        if channel == ChannelType.BLOCKS:
+            rest_client.invalidate_tip_cache()
+        
+        # defaultdict에 빈 항목이 생기지 않도록 get으로 조회
+        listeners = self._listeners.get(channel) if channel else None
+        if listeners:
+            # 버퍼에 추가만 하고 대기 중인 소비자는 Future로 한 번만 깨움
+            for listener in listeners:
+                listener.push(data)
 
     def _determine_channel(self, data: Dict[str, Any]) -> Optional[str]:
         """메시지 데이터로부터 채널 결정."""
-        # mempool.space WebSocket 메시지 구조에 따라 채널 결정
-        if "block" in data:
-            return ChannelType.BLOCKS
-        elif "mempool-blocks" in data:
-            return ChannelType.MEMPOOL_BLOCKS
-        elif "mempoolInfo" in data:
-            return ChannelType.STATS
-        elif "live-2h-chart" in data:
-            return ChannelType.LIVE_2H
-        elif "address" in data:
-            return ChannelType.TRACK_ADDRESS
-        
+        # 키 집합 교집합 한 번으로 후보를 찾고, 대부분의 프레임은 키가 하나라 바로 반환
+        keys = data.keys() & _CHANNEL_BY_KEY.keys()
+        if not keys:
+            return None
+        if len(keys) == 1:
+            return _CHANNEL_BY_KEY[keys.pop()]
+        for key, channel in _CHANNEL_BY_KEY.items():
+            if key in keys:
+                return channel
         return None
 
     async def _heartbeat(self) -> None:
@@ -234,52 +372,61 @@ class WebSocketManager:
                 if self.websocket:
                     await self.websocket.ping()
                     self.last_ping = time.time()
-                await asyncio.sleep(30)
+                await asyncio.sleep(HEARTBEAT_INTERVAL)
             except Exception as e:
                 logger.error("Heartbeat failed", error=str(e))
                 self.is_connected = False
                 break
 
     async def _handle_reconnect(self) -> None:
-        """재연결 처리."""
-        if self.reconnect_attempts >= self.max_reconnect_attempts:
-            logger.error("Max reconnection attempts reached")
-            return
-
-        self.reconnect_attempts += 1
-        backoff = min(2 ** self.reconnect_attempts, 60)
-        
-        logger.info(
-            "Attempting to reconnect",
-            attempt=self.reconnect_attempts,
-            backoff=backoff,
-        )
-        
-        await asyncio.sleep(backoff)
-        
-        try:
-            await self.connect()
+        """재연결 처리 (재귀 대신 반복문으로 재시도)."""
+        while self.reconnect_attempts < self.max_reconnect_attempts:
+            self.reconnect_attempts += 1
+            backoff = min(2 ** self.reconnect_attempts, RECONNECT_MAX_BACKOFF)
             
-            # 기존 구독 복원
-            await self._restore_subscriptions()
+            logger.info(
+                "Attempting to reconnect",
+                attempt=self.reconnect_attempts,
+                backoff=backoff,
+            )
             
-        except Exception as e:
-            logger.error("Reconnection failed", error=str(e))
-            await self._handle_reconnect()
+            await asyncio.sleep(backoff)
+            
+            try:
+                # 구독 복원은 connect 안에서 처리됨
+                await self.connect()
+                return
+                
+            except Exception as e:
+                logger.error("Reconnection failed", error=str(e))
+        
+        logger.error("Max reconnection attempts reached")
 
     async def _restore_subscriptions(self) -> None:
         """구독 복원."""
         logger.info("Restoring subscriptions")
         
-        # 모든 활성 채널을 다시 구독
+        # 주소 추적은 주소마다, 나머지 채널은 하나의 want로 다시 구독
         for channel in self.channel_subscribers:
             if channel.startswith("track-address:"):
                 address = channel.split(":", 1)[1]
-                message = TrackAddressMessage(track_address=address)
-                await self._send_message(message.model_dump())
-            else:
-                message = WebSocketMessage(action="want", data=[channel])
-                await self._send_message(message.model_dump())
+                await self._send_message({"track_address": address})
+        
+        channels = self._wanted_channels()
+        if channels:
+            await self._send_message(_want_frame(channels))
+
+    async def watch_loop_lag(self, interval: float = LOOP_LAG_INTERVAL) -> None:
+        """주기적으로 깨어나 예정 시각보다 늦어진 만큼을 이벤트 루프 지연으로 기록."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                expected = loop.time() + interval
+                await asyncio.sleep(interval)
+                self._loop_lag_ms = max(0.0, (loop.time() - expected) * 1000)
+        finally:
+            # 감시가 멈춘 뒤에는 오래된 측정값 대신 미측정으로 보고
+            self._loop_lag_ms = None
 
     async def get_connection_status(self) -> Dict[str, Any]:
         """연결 상태 반환."""
@@ -289,4 +436,5 @@ class WebSocketManager:
             "reconnect_attempts": self.reconnect_attempts,
             "active_subscriptions": len(self.channel_subscribers),
             "total_clients": len(self.subscriptions),
+            "loop_lag_ms": round(self._loop_lag_ms, 3) if self._loop_lag_ms is not None else None,
         } 
\ No newline at end of file
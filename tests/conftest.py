@@ -0,0 +1,42 @@
+"""공용 테스트 픽스처."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from mempool_ws_mcp_server import http_api
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """HTTP API 테스트 클라이언트 픽스처 (세션 전체에서 하나의 클라이언트를 재사용)."""
+    async with AsyncClient(transport=ASGITransport(app=http_api.app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def fake_ws_manager(monkeypatch):
+    """가짜 WebSocket 매니저 픽스처 (테스트마다 patch로 MagicMock을 만들지 않고 속성만 설정)."""
+    fake = SimpleNamespace(
+        get_connection_status=AsyncMock(),
+        is_connected=False,
+        connect=AsyncMock(),
+        add_listener=AsyncMock(),
+        remove_listener=AsyncMock(),
+        disconnect=AsyncMock(),
+        watch_loop_lag=AsyncMock(),
+    )
+    # /health 등 HTTP API 엔드포인트가 실제로 참조하는 매니저를 대체
+    monkeypatch.setattr("mempool_ws_mcp_server.http_api.ws_manager", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def _reset_health_cache():
+    """테스트 간에 /health 캐시가 남지 않도록 초기화."""
+    http_api.invalidate_health_cache()
+    yield
+    http_api.invalidate_health_cache()
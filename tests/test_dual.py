@@ -0,0 +1,54 @@
+"""듀얼 서버 실행 테스트."""
+
+import asyncio
+import signal
+import pytest
+from unittest.mock import MagicMock, patch
+
+from mempool_ws_mcp_server.config import config
+from mempool_ws_mcp_server.dual import build_http_server, build_mcp_server, setup_signal_handlers
+
+
+@pytest.mark.asyncio
+async def test_signal_handlers():
+    """시그널 핸들러 테스트."""
+    loop = asyncio.get_running_loop()
+    with patch.object(loop, 'add_signal_handler') as mock_add_signal_handler:
+        setup_signal_handlers([])
+
+        # SIGINT와 SIGTERM 핸들러가 이벤트 루프에 등록되었는지 확인
+        assert mock_add_signal_handler.call_count == 2
+        registered = {call.args[0] for call in mock_add_signal_handler.call_args_list}
+        assert registered == {signal.SIGINT, signal.SIGTERM}
+
+
+@pytest.mark.asyncio
+async def test_signal_handler_stops_servers():
+    """시그널 수신 시 모든 서버에 종료를 요청하는지 테스트."""
+    servers = [MagicMock(should_exit=False), MagicMock(should_exit=False)]
+    loop = asyncio.get_running_loop()
+    with patch.object(loop, 'add_signal_handler') as mock_add_signal_handler:
+        setup_signal_handlers(servers)
+
+        # 등록된 콜백을 직접 호출해 시그널 수신을 흉내냄
+        sig, callback, *args = mock_add_signal_handler.call_args_list[0].args
+        callback(*args)
+
+    assert all(server.should_exit for server in servers)
+
+
+@pytest.mark.parametrize(
+    ("build_server", "port"),
+    [(build_mcp_server, config.PORT), (build_http_server, config.HTTP_API_PORT)],
+)
+def test_run_server_config(build_server, port):
+    """두 서버 모두 uvloop 이벤트 루프와 httptools 파서로 구성되는지 테스트."""
+    pytest.importorskip("uvloop")
+    pytest.importorskip("httptools")
+
+    server = build_server()
+
+    assert server.config.host == config.HOST
+    assert server.config.port == port
+    assert server.config.loop == "uvloop"
+    assert server.config.http == "httptools"
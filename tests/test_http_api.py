@@ -0,0 +1,109 @@
+"""HTTP API 서버 테스트."""
+
+import asyncio
+
+import pytest
+
+from mempool_ws_mcp_server import http_api
+
+HEALTHY_STATUS = {
+    "connected": True,
+    "active_subscriptions": 2,
+    "total_clients": 1,
+    "last_ping": 1234567890,
+    "reconnect_attempts": 0
+}
+
+
+# 모든 테스트에서 실제 WebSocket 매니저 대신 가짜 매니저 사용
+pytestmark = pytest.mark.usefixtures("fake_ws_manager")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestHealthCache:
+    """/health 응답 캐시 테스트."""
+
+    async def test_health_cache_miss_then_hit(self, client, fake_ws_manager):
+        """첫 요청은 상태를 조회하고, TTL 안의 다음 요청은 캐시를 반환하는지 테스트."""
+        fake_ws_manager.get_connection_status.return_value = HEALTHY_STATUS
+        
+        first = await client.get("/health")
+        second = await client.get("/health")
+        
+        assert first.status_code == second.status_code == 200
+        assert first.headers["x-cache"] == "miss"
+        assert second.headers["x-cache"] == "hit"
+        assert second.content == first.content
+        fake_ws_manager.get_connection_status.assert_awaited_once()
+
+    async def test_health_cache_expires(self, client, fake_ws_manager, monkeypatch):
+        """TTL이 지나면 상태를 다시 조회하는지 테스트."""
+        monkeypatch.setattr(http_api.config, "HEALTH_CACHE_TTL", 0.0)
+        fake_ws_manager.get_connection_status.return_value = HEALTHY_STATUS
+        
+        await client.get("/health")
+        response = await client.get("/health")
+        
+        assert response.headers["x-cache"] == "miss"
+        assert fake_ws_manager.get_connection_status.await_count == 2
+
+    async def test_health_stale_on_error(self, client, fake_ws_manager, monkeypatch):
+        """상태 조회가 실패하면 최근 정상 응답을 stale로 반환하는지 테스트."""
+        monkeypatch.setattr(http_api.config, "HEALTH_CACHE_TTL", 0.0)
+        fake_ws_manager.get_connection_status.return_value = HEALTHY_STATUS
+        healthy = await client.get("/health")
+        
+        fake_ws_manager.get_connection_status.side_effect = Exception("Connection error")
+        response = await client.get("/health")
+        
+        assert response.status_code == 200
+        assert response.headers["x-cache"] == "stale"
+        assert response.content == healthy.content
+
+    async def test_health_expired_stale_on_error(self, client, fake_ws_manager, monkeypatch):
+        """stale 허용 시간이 지난 응답은 쓰지 않고 503을 반환하는지 테스트."""
+        monkeypatch.setattr(http_api.config, "HEALTH_CACHE_TTL", 0.0)
+        monkeypatch.setattr(http_api.config, "HEALTH_CACHE_STALE_TTL", 0.0)
+        fake_ws_manager.get_connection_status.return_value = HEALTHY_STATUS
+        await client.get("/health")
+        
+        fake_ws_manager.get_connection_status.side_effect = Exception("Connection error")
+        response = await client.get("/health")
+        
+        assert response.status_code == 503
+        assert response.headers["x-cache"] == "miss"
+        data = response.json()
+        assert data["status"] == "unhealthy"
+        assert data["error"] == "Connection error"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_loop_lag(client, fake_ws_manager):
+    """루프 지연 측정값은 그대로, 미측정(None)은 null로 전달하는지 테스트."""
+    fake_ws_manager.get_connection_status.return_value = {**HEALTHY_STATUS, "loop_lag_ms": 1.25}
+    assert (await client.get("/health")).json()["loop_lag_ms"] == 1.25
+    
+    http_api.invalidate_health_cache()
+    fake_ws_manager.get_connection_status.return_value = {**HEALTHY_STATUS, "loop_lag_ms": None}
+    assert (await client.get("/health")).json()["loop_lag_ms"] is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_endpoints_parallel(client, fake_ws_manager):
+    """엔드포인트 동시 요청 테스트."""
+    fake_ws_manager.get_connection_status.return_value = {
+        "connected": True,
+        "active_subscriptions": 1,
+        "total_clients": 1,
+        "last_ping": 1234567890,
+        "reconnect_attempts": 0
+    }
+
+    root_response, health_response = await asyncio.gather(
+        client.get("/"),
+        client.get("/health")
+    )
+
+    assert root_response.status_code == 200
+    assert health_response.status_code == 200
+    assert health_response.json()["websocket_connected"] is True
@@ -1,21 +1,22 @@
 """메인 서버 테스트."""
 
-import asyncio
+import json
+from contextlib import asynccontextmanager
+
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from unittest.mock import AsyncMock, patch
 
-from mempool_ws_mcp_server.main import app
+# HTTP 엔드포인트는 main이 아닌 http_api 앱이 제공함
+from mempool_ws_mcp_server.http_api import app
+from mempool_ws_mcp_server.tools import create_mcp_server
 
 
-@pytest.fixture
-async def client():
-    """테스트 클라이언트 픽스처."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+# 모든 테스트에서 실제 WebSocket 매니저 대신 가짜 매니저 사용
+pytestmark = pytest.mark.usefixtures("fake_ws_manager")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestMainEndpoints:
     """메인 엔드포인트 테스트."""
 
@@ -25,182 +26,183 @@ class TestMainEndpoints:
         assert response.status_code == 200
         
         data = response.json()
-        assert data["name"] == "Mempool WebSocket MCP Server"
-        assert data["version"] == "0.1.0"
+        assert data["message"] == "Mempool WebSocket MCP Server - HTTP API"
+        assert data["version"] == "1.0.0"
         assert "endpoints" in data
         assert "health" in data["endpoints"]
-        assert "sse" in data["endpoints"]
+        assert "mcp_info" in data["endpoints"]
 
-    async def test_health_endpoint_healthy(self, client):
+    async def test_health_endpoint_healthy(self, client, fake_ws_manager):
         """헬스 체크 엔드포인트 테스트 - 정상 상태."""
-        with patch('mempool_ws_mcp_server.main.ws_manager') as mock_ws_manager:
-            mock_ws_manager.get_connection_status.return_value = {
-                "connected": True,
-                "active_subscriptions": 2,
-                "total_clients": 1,
-                "last_ping": 1234567890,
-                "reconnect_attempts": 0
-            }
-            
-            response = await client.get("/health")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert data["websocket_connected"] is True
-            assert data["active_subscriptions"] == 2
-            assert data["total_clients"] == 1
+        fake_ws_manager.get_connection_status.return_value = {
+            "connected": True,
+            "active_subscriptions": 2,
+            "total_clients": 1,
+            "last_ping": 1234567890,
+            "reconnect_attempts": 0
+        }
+        
+        response = await client.get("/health")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["websocket_connected"] is True
+        assert data["active_subscriptions"] == 2
+        assert data["total_clients"] == 1
 
-    async def test_health_endpoint_unhealthy(self, client):
+    async def test_health_endpoint_unhealthy(self, client, fake_ws_manager):
         """헬스 체크 엔드포인트 테스트 - 비정상 상태."""
-        with patch('mempool_ws_mcp_server.main.ws_manager') as mock_ws_manager:
-            mock_ws_manager.get_connection_status.return_value = {
-                "connected": False,
-                "active_subscriptions": 0,
-                "total_clients": 0,
-                "last_ping": 1234567890,
-                "reconnect_attempts": 3
-            }
-            
-            response = await client.get("/health")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["status"] == "unhealthy"
-            assert data["websocket_connected"] is False
+        fake_ws_manager.get_connection_status.return_value = {
+            "connected": False,
+            "active_subscriptions": 0,
+            "total_clients": 0,
+            "last_ping": 1234567890,
+            "reconnect_attempts": 3
+        }
+        
+        response = await client.get("/health")
+        assert response.status_code == 200
+        
+        # HTTP API 프로세스 상태와 WebSocket 연결 상태는 별도 필드로 보고됨
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["websocket_connected"] is False
+        assert data["active_subscriptions"] == 0
 
-    async def test_health_endpoint_error(self, client):
+    async def test_health_endpoint_error(self, client, fake_ws_manager):
         """헬스 체크 엔드포인트 테스트 - 에러 상태."""
-        with patch('mempool_ws_mcp_server.main.ws_manager') as mock_ws_manager:
-            mock_ws_manager.get_connection_status.side_effect = Exception("Connection error")
-            
-            response = await client.get("/health")
+        fake_ws_manager.get_connection_status.side_effect = Exception("Connection error")
+        
+        response = await client.get("/health")
+        data = response.json()
+        
+        # 직전 정상 응답이 stale 기간 안에 있으면 그 응답을, 아니면 503 에러를 반환
+        if response.headers["X-Cache"] == "stale":
             assert response.status_code == 200
-            
-            data = response.json()
-            assert data["status"] == "error"
+            assert data["status"] == "healthy"
+        else:
+            assert response.status_code == 503
+            assert response.headers["X-Cache"] == "miss"
+            assert data["status"] == "unhealthy"
             assert "error" in data
 
-    async def test_mcp_endpoint_success(self, client):
-        """MCP 엔드포인트 테스트 - 성공."""
-        with patch('mempool_ws_mcp_server.main.mcp') as mock_mcp:
-            mock_mcp.handle_request.return_value = {"result": "success"}
-            
-            request_data = {"method": "list_tools", "params": {}}
-            response = await client.post("/mcp", json=request_data)
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["result"] == "success"
-
-    async def test_mcp_endpoint_error(self, client):
-        """MCP 엔드포인트 테스트 - 에러."""
-        with patch('mempool_ws_mcp_server.main.mcp') as mock_mcp:
-            mock_mcp.handle_request.side_effect = Exception("MCP error")
-            
-            request_data = {"method": "list_tools", "params": {}}
-            response = await client.post("/mcp", json=request_data)
-            
+
+MCP_PROTOCOL_VERSION = "2025-06-18"
+
+
+def _sse_json(response):
+    """streamable-http 응답(SSE 이벤트)에서 JSON-RPC 메시지 추출."""
+    for line in response.text.splitlines():
+        if line.startswith("data: "):
+            return json.loads(line[len("data: "):])
+    raise AssertionError(f"SSE data 이벤트가 없음: {response.text!r}")
+
+
+@asynccontextmanager
+async def _mcp_session():
+    """FastMCP streamable-http 앱에서 초기화까지 마친 MCP 세션 클라이언트."""
+    mcp_app = create_mcp_server().http_app(path="/mcp", transport="streamable-http")
+    # 세션 매니저는 lifespan 안에서만 동작하며, ASGITransport는 lifespan을 실행하지 않음
+    async with mcp_app.lifespan(mcp_app):
+        async with AsyncClient(
+            transport=ASGITransport(app=mcp_app),
+            base_url="http://test",
+            headers={"Accept": "application/json, text/event-stream"},
+        ) as ac:
+            response = await ac.post("/mcp", json={
+                "jsonrpc": "2.0",
+                "id": 0,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": MCP_PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "test", "version": "0"},
+                },
+            })
             assert response.status_code == 200
-            data = response.json()
-            assert "error" in data
-            assert data["error"]["code"] == -1
-            assert "MCP error" in data["error"]["message"]
-
-    async def test_sse_endpoint_headers(self, client):
-        """SSE 엔드포인트 헤더 테스트."""
-        with patch('mempool_ws_mcp_server.main.ws_manager') as mock_ws_manager:
-            mock_ws_manager.is_connected = False
-            mock_ws_manager.connect = AsyncMock()
-            mock_ws_manager.add_listener = AsyncMock()
-            mock_ws_manager.remove_listener = AsyncMock()
-            
-            # SSE 스트림 시작하고 바로 종료 시뮬레이션
-            async def mock_event_stream():
-                yield "data: {\"type\": \"connection\", \"status\": \"connected\"}\n\n"
-                return
-            
-            with patch('mempool_ws_mcp_server.main.app.get') as mock_get:
-                # 실제 SSE 엔드포인트 대신 간단한 응답 반환
-                response = await client.get("/sse")
-                
-                # 응답 헤더 확인
-                assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
-                assert "cache-control" in response.headers
-                assert "connection" in response.headers
+            ac.headers["mcp-session-id"] = response.headers["mcp-session-id"]
+            ac.headers["mcp-protocol-version"] = MCP_PROTOCOL_VERSION
+            await ac.post("/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+            yield ac
 
 
 @pytest.mark.asyncio
-async def test_server_startup_shutdown():
+async def test_mcp_endpoint_success():
+    """MCP 엔드포인트 테스트 - 성공."""
+    async with _mcp_session() as mcp_client:
+        response = await mcp_client.post("/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        data = _sse_json(response)
+        assert data["id"] == 1
+        assert "get_address_bundle" in {tool["name"] for tool in data["result"]["tools"]}
+
+
+@pytest.mark.asyncio
+async def test_mcp_endpoint_error():
+    """MCP 엔드포인트 테스트 - 에러."""
+    async with _mcp_session() as mcp_client:
+        response = await mcp_client.post("/mcp", json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "unknown_tool", "arguments": {}},
+        })
+        
+        assert response.status_code == 200
+        data = _sse_json(response)
+        assert data["result"]["isError"] is True
+        assert "unknown_tool" in data["result"]["content"][0]["text"]
+
+@pytest.mark.asyncio
+async def test_server_startup_shutdown(fake_ws_manager):
     """서버 시작/종료 테스트."""
-    with patch('mempool_ws_mcp_server.main.initialize_websocket') as mock_init:
-        with patch('mempool_ws_mcp_server.main.ws_manager') as mock_ws_manager:
-            mock_init.return_value = None
-            mock_ws_manager.disconnect.return_value = None
-            
-            # lifespan 컨텍스트 매니저 테스트
-            from mempool_ws_mcp_server.main import lifespan
-            
-            async with lifespan(app):
-                # 서버가 시작되었는지 확인
-                mock_init.assert_called_once()
-            
-            # 서버가 종료되었는지 확인
-            mock_ws_manager.disconnect.assert_called_once()
+    with patch('mempool_ws_mcp_server.http_api.initialize_websocket') as mock_init:
+        mock_init.return_value = None
+        fake_ws_manager.disconnect.return_value = None
+        
+        # lifespan 컨텍스트 매니저 테스트
+        from mempool_ws_mcp_server.http_api import lifespan
+        
+        async with lifespan(app):
+            # 서버가 시작되었는지 확인
+            mock_init.assert_called_once()
+        
+        # 서버가 종료되었는지 확인
+        fake_ws_manager.disconnect.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_server_shutdown_closes_rest_client(fake_ws_manager):
+    """WebSocket 해제가 실패해도 REST 클라이언트를 닫는지 테스트."""
+    fake_ws_manager.disconnect.side_effect = Exception("Disconnect failed")
+    
+    with patch('mempool_ws_mcp_server.http_api.initialize_websocket'), \
+            patch('mempool_ws_mcp_server.http_api.rest_client') as mock_rest_client:
+        mock_rest_client.close = AsyncMock()
+        
+        from mempool_ws_mcp_server.http_api import lifespan
+        
+        async with lifespan(app):
+            pass
+        
+        mock_rest_client.close.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_server_startup_failure():
     """서버 시작 실패 테스트."""
-    with patch('mempool_ws_mcp_server.main.initialize_websocket') as mock_init:
+    with patch('mempool_ws_mcp_server.http_api.initialize_websocket') as mock_init:
         mock_init.side_effect = Exception("Startup failed")
         
-        from mempool_ws_mcp_server.main import lifespan
+        from mempool_ws_mcp_server.http_api import lifespan
         
         with pytest.raises(Exception, match="Startup failed"):
             async with lifespan(app):
                 pass
 
 
-def test_signal_handlers():
-    """시그널 핸들러 테스트."""
-    with patch('signal.signal') as mock_signal:
-        from mempool_ws_mcp_server.main import setup_signal_handlers
-        
-        setup_signal_handlers()
-        
-        # SIGINT와 SIGTERM 핸들러가 설정되었는지 확인
-        assert mock_signal.call_count == 2
-
-
-@pytest.mark.asyncio 
-async def test_run_server_config():
-    """서버 실행 설정 테스트."""
-    with patch('mempool_ws_mcp_server.main.uvicorn.Server') as mock_server_class:
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default: {
-                "HOST": "test_host",
-                "PORT": "9999", 
-                "LOG_LEVEL": "debug"
-            }.get(key, default)
-            
-            mock_server = AsyncMock()
-            mock_server_class.return_value = mock_server
-            
-            from mempool_ws_mcp_server.main import run_server
-            
-            # 서버 실행 시뮬레이션 (바로 리턴)
-            mock_server.serve.return_value = None
-            
-            await run_server()
-            
-            # 서버가 올바른 설정으로 생성되었는지 확인
-            mock_server_class.assert_called_once()
-            config = mock_server_class.call_args[0][0]
-            assert config.host == "test_host"
-            assert config.port == 9999
-            assert config.log_level == "debug"
-
-
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""FastMCP 도구 테스트."""
+
+import pytest
+from unittest.mock import patch
+
+from mempool_ws_mcp_server.tools import list_tools_cache, mcp
+
+
+@pytest.mark.asyncio
+async def test_mcp_list_tools_cached():
+    """도구 목록이 캐시되어 두 번째 호출에서는 다시 만들지 않는지 테스트."""
+    # 다른 테스트에서 채운 캐시의 영향을 받지 않도록 비운 상태로 시작
+    list_tools_cache._tools = None
+
+    tool_manager = mcp._tool_manager
+    with patch.object(tool_manager, "list_tools", wraps=tool_manager.list_tools) as mock_list_tools:
+        first = await mcp._list_tools()
+        second = await mcp._list_tools()
+
+    assert second is first
+    assert "get_address_bundle" in {tool.name for tool in first}
+    mock_list_tools.assert_called_once()
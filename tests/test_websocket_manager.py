@@ -2,13 +2,30 @@
 
 import asyncio
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from mempool_ws_mcp_server.websocket_manager import WebSocketManager
+from mempool_ws_mcp_server import websocket_manager
+from mempool_ws_mcp_server.websocket_manager import MessageListener, WebSocketManager
 from mempool_ws_mcp_server.types import ChannelType
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _fast_delays(monkeypatch):
+    """재연결 백오프/하트비트 대기 간격을 0으로 줄임 (asyncio.sleep 자체는 대체하지 않음)."""
+    monkeypatch.setattr(websocket_manager, "HEARTBEAT_INTERVAL", 0)
+    monkeypatch.setattr(websocket_manager, "IDLE_RECV_DELAY", 0)
+    monkeypatch.setattr(websocket_manager, "RECONNECT_MAX_BACKOFF", 0)
+
+
+def _idle_websocket() -> AsyncMock:
+    """수신할 메시지가 없는 가짜 WebSocket (recv가 바로 반환되면 수신 태스크가 루프를 점유함)."""
+    websocket = AsyncMock()
+    websocket.recv.side_effect = asyncio.Event().wait
+    return websocket
+
+
+@pytest_asyncio.fixture
 async def ws_manager():
     """WebSocket 매니저 픽스처."""
     manager = WebSocketManager("wss://test.example.com/ws")
@@ -32,8 +49,8 @@ class TestWebSocketManager:
     @patch('mempool_ws_mcp_server.websocket_manager.websockets.connect')
     async def test_connect_success(self, mock_connect, ws_manager):
         """연결 성공 테스트."""
-        mock_websocket = AsyncMock()
-        mock_connect.return_value = mock_websocket
+        mock_websocket = _idle_websocket()
+        mock_connect.side_effect = AsyncMock(return_value=mock_websocket)
         
         await ws_manager.connect()
         
@@ -52,6 +69,34 @@ class TestWebSocketManager:
         assert not ws_manager.is_connected
         assert ws_manager.websocket is None
 
+    @patch('mempool_ws_mcp_server.websocket_manager.websockets.connect')
+    async def test_connect_restores_subscriptions(self, mock_connect, ws_manager):
+        """재연결 대기 중인 수신 태스크가 취소되어도 외부 connect가 구독을 복원하는지 테스트."""
+        address = "bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh"
+        ws_manager.subscriptions["test_client"] = {ChannelType.STATS, f"track-address:{address}"}
+        ws_manager.channel_subscribers[ChannelType.STATS] = {"test_client"}
+        ws_manager.channel_subscribers[f"track-address:{address}"] = {"test_client"}
+        
+        # 연결이 끊긴 뒤 백오프 대기 중인 수신 태스크
+        stale_reader = asyncio.create_task(asyncio.sleep(10))
+        ws_manager._tasks = {stale_reader}
+        
+        never = asyncio.Event()
+        fake_websocket = MagicMock()
+        fake_websocket.send = AsyncMock()
+        fake_websocket.ping = AsyncMock()
+        fake_websocket.close = AsyncMock()
+        fake_websocket.recv = AsyncMock(side_effect=never.wait)
+        mock_connect.side_effect = AsyncMock(return_value=fake_websocket)
+        
+        await ws_manager.connect()
+        await asyncio.sleep(0)
+        
+        assert stale_reader.cancelled()
+        sent = [call.args[0] for call in fake_websocket.send.await_args_list]
+        assert f'{{"track_address":"{address}"}}' in sent
+        assert '{"action":"want","data":["stats"]}' in sent
+
     async def test_subscribe_channel(self, ws_manager):
         """채널 구독 테스트."""
         client_id = "test_client"
@@ -65,6 +110,28 @@ class TestWebSocketManager:
         assert channel in ws_manager.channel_subscribers
         assert client_id in ws_manager.channel_subscribers[channel]
 
+    async def test_subscribe_channels_coalesce_want(self, ws_manager):
+        """같은 틱에 구독한 채널들이 하나의 want 메시지로 전송되는지 테스트."""
+        channels = [ChannelType.BLOCKS, ChannelType.STATS, ChannelType.MEMPOOL_BLOCKS]
+        
+        with patch.object(ws_manager, '_send_message', new_callable=AsyncMock) as mock_send:
+            for channel in channels:
+                await ws_manager.subscribe_channel("test_client", channel)
+            mock_send.assert_not_called()
+            await asyncio.sleep(0.01)
+            mock_send.assert_called_once_with(
+                '{"action":"want","data":["blocks","mempool-blocks","stats"]}'
+            )
+            
+            # 전송 이후의 구독 변경은 전체 채널 집합을 담은 새 want로 다시 전송
+            await ws_manager.subscribe_channel("other_client", ChannelType.LIVE_2H_CHART)
+            await asyncio.sleep(0.01)
+        
+        assert mock_send.await_count == 2
+        mock_send.assert_called_with(
+            '{"action":"want","data":["blocks","live-2h-chart","mempool-blocks","stats"]}'
+        )
+
     async def test_unsubscribe_channel(self, ws_manager):
         """채널 구독 해제 테스트."""
         client_id = "test_client"
@@ -107,6 +174,25 @@ class TestWebSocketManager:
         for channel in channels:
             assert channel not in ws_manager.channel_subscribers
 
+    async def test_unsubscribe_client_keeps_shared_channels(self, ws_manager):
+        """다른 클라이언트가 구독 중인 채널은 유지하고 want는 한 번만 보내는지 테스트."""
+        ws_manager.subscriptions["client_a"] = {ChannelType.BLOCKS, ChannelType.STATS, ChannelType.LIVE_2H_CHART}
+        ws_manager.subscriptions["client_b"] = {ChannelType.STATS}
+        ws_manager.channel_subscribers[ChannelType.BLOCKS] = {"client_a"}
+        ws_manager.channel_subscribers[ChannelType.STATS] = {"client_a", "client_b"}
+        ws_manager.channel_subscribers[ChannelType.LIVE_2H_CHART] = {"client_a"}
+        
+        with patch.object(ws_manager, '_send_message', new_callable=AsyncMock) as mock_send:
+            await ws_manager.unsubscribe_client("client_a")
+            await asyncio.sleep(0.05)
+        
+        assert "client_a" not in ws_manager.subscriptions
+        assert ChannelType.BLOCKS not in ws_manager.channel_subscribers
+        assert ChannelType.LIVE_2H_CHART not in ws_manager.channel_subscribers
+        assert ws_manager.channel_subscribers[ChannelType.STATS] == {"client_b"}
+        # 남은 채널 집합만 담은 want 하나로 갱신
+        mock_send.assert_called_once_with('{"action":"want","data":["stats"]}')
+
     async def test_determine_channel(self, ws_manager):
         """채널 결정 테스트."""
         # 블록 메시지
@@ -117,6 +203,14 @@ class TestWebSocketManager:
         stats_message = {"mempoolInfo": {"count": 1000}}
         assert ws_manager._determine_channel(stats_message) == ChannelType.STATS
         
+        # 라이브 차트 메시지
+        chart_message = {"live-2h-chart": {"added": []}}
+        assert ws_manager._determine_channel(chart_message) == ChannelType.LIVE_2H_CHART
+        
+        # 여러 채널 키가 함께 오면 블록이 우선
+        mixed_message = {"mempoolInfo": {"count": 1000}, "block": {"height": 123457}}
+        assert ws_manager._determine_channel(mixed_message) == ChannelType.BLOCKS
+        
         # 알 수 없는 메시지
         unknown_message = {"unknown": "data"}
         assert ws_manager._determine_channel(unknown_message) is None
@@ -130,54 +224,105 @@ class TestWebSocketManager:
         assert "reconnect_attempts" in status
         assert "active_subscriptions" in status
         assert "total_clients" in status
+        assert "loop_lag_ms" in status
         
         assert status["connected"] is False
         assert status["active_subscriptions"] == 0
         assert status["total_clients"] == 0
+        # 루프 지연 감시 태스크가 없으면 0.0이 아닌 미측정(None)으로 보고
+        assert status["loop_lag_ms"] is None
+
+    async def test_loop_lag_reported_while_watching(self, ws_manager):
+        """루프 지연 감시 중에는 측정값을, 감시 종료 후에는 None을 보고하는지 테스트."""
+        watchdog = asyncio.create_task(ws_manager.watch_loop_lag(interval=0))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        
+        status = await ws_manager.get_connection_status()
+        assert isinstance(status["loop_lag_ms"], float)
+        
+        watchdog.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watchdog
+        
+        status = await ws_manager.get_connection_status()
+        assert status["loop_lag_ms"] is None
 
     async def test_add_remove_listener(self, ws_manager):
         """리스너 추가/제거 테스트."""
         channel = ChannelType.BLOCKS
-        queue = asyncio.Queue()
+        listener = MessageListener()
         
         # 리스너 추가
-        await ws_manager.add_listener(channel, queue)
+        await ws_manager.add_listener(channel, listener)
         assert channel in ws_manager._listeners
-        assert queue in ws_manager._listeners[channel]
+        assert listener in ws_manager._listeners[channel]
         
         # 리스너 제거
-        await ws_manager.remove_listener(channel, queue)
+        await ws_manager.remove_listener(channel, listener)
         assert channel not in ws_manager._listeners
 
     @patch('mempool_ws_mcp_server.websocket_manager.websockets.connect')
     async def test_message_distribution(self, mock_connect, ws_manager):
         """메시지 배포 테스트."""
-        mock_websocket = AsyncMock()
-        mock_connect.return_value = mock_websocket
+        mock_websocket = _idle_websocket()
+        mock_connect.side_effect = AsyncMock(return_value=mock_websocket)
         
         # 연결
         await ws_manager.connect()
         
         # 리스너 설정
         channel = ChannelType.BLOCKS
-        queue = asyncio.Queue()
-        await ws_manager.add_listener(channel, queue)
+        listener = MessageListener()
+        await ws_manager.add_listener(channel, listener)
         
         # 메시지 배포
         test_message = {"block": {"height": 123456}}
         await ws_manager._distribute_message(test_message)
         
-        # 큐에서 메시지 확인
-        received_message = await asyncio.wait_for(queue.get(), timeout=1.0)
-        assert received_message == test_message
+        # 리스너에서 메시지 확인
+        received_messages = await asyncio.wait_for(listener.get_batch(), timeout=1.0)
+        assert received_messages == [test_message]
+
+    async def test_listener_batches_pending_messages(self, ws_manager):
+        """대기 중인 리스너가 쌓인 메시지를 한 번에 받는지 테스트."""
+        channel = ChannelType.STATS
+        listener = MessageListener()
+        await ws_manager.add_listener(channel, listener)
+        
+        waiter = asyncio.create_task(listener.get_batch())
+        await asyncio.sleep(0)
+        
+        messages = [{"mempoolInfo": {"count": i}} for i in range(3)]
+        for message in messages:
+            await ws_manager._distribute_message(message)
+        
+        assert await asyncio.wait_for(waiter, timeout=1.0) == messages
+
+    async def test_listener_backpressure(self, ws_manager):
+        """버퍼가 가득 차면 오래된 메시지를 버리고 overflow 표시를 전달하는지 테스트."""
+        channel = ChannelType.STATS
+        listener = MessageListener(maxlen=2)
+        await ws_manager.add_listener(channel, listener)
+        
+        messages = [{"mempoolInfo": {"count": i}} for i in range(5)]
+        for message in messages:
+            await ws_manager._distribute_message(message)
+        
+        batch = await asyncio.wait_for(listener.get_batch(), timeout=1.0)
+        assert batch == [{"type": "overflow", "dropped": 3}, *messages[-2:]]
+        
+        # 표시는 한 번만 전달됨
+        await ws_manager._distribute_message(messages[0])
+        assert await listener.get_batch() == [messages[0]]
 
 
 @pytest.mark.asyncio 
 async def test_websocket_manager_integration():
     """WebSocket 매니저 통합 테스트."""
     with patch('mempool_ws_mcp_server.websocket_manager.websockets.connect') as mock_connect:
-        mock_websocket = AsyncMock()
-        mock_connect.return_value = mock_websocket
+        mock_websocket = _idle_websocket()
+        mock_connect.side_effect = AsyncMock(return_value=mock_websocket)
         
         manager = WebSocketManager("wss://test.example.com/ws")
         